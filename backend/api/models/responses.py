@@ -2,25 +2,37 @@
 
 from datetime import datetime
 from typing import Optional, Dict, List, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class RunSummary(BaseModel):
-    """Summary information for a benchmark run (list view)."""
+    """Summary information for a benchmark run (list view).
 
-    run_id: str = Field(..., description="Unique run identifier")
-    dataset: str = Field(..., description="Dataset name (e.g., 'qasper', 'policyqa')")
-    split: str = Field(..., description="Dataset split (e.g., 'train', 'validation')")
+    Validation aliases match the Prisma BenchmarkRun fields, so rows can be
+    loaded directly with ``RunSummary.model_validate(run)``.
+    """
+
+    run_id: str = Field(..., validation_alias="runId", description="Unique run identifier")
+    dataset: str = Field(..., validation_alias="datasetName", description="Dataset name (e.g., 'qasper', 'policyqa')")
+    split: str = Field(..., validation_alias="datasetSplit", description="Dataset split (e.g., 'train', 'validation')")
     providers: List[str] = Field(..., description="List of provider names tested")
     status: str = Field(..., description="Run status (queued, running, completed, failed)")
-    num_docs: int = Field(..., description="Number of documents processed")
-    num_questions: int = Field(..., description="Total number of questions")
-    started_at: datetime = Field(..., description="Run start timestamp")
-    completed_at: Optional[datetime] = Field(None, description="Run completion timestamp")
-    duration_seconds: Optional[float] = Field(None, description="Total duration in seconds")
+    num_docs: int = Field(..., validation_alias="numDocs", description="Number of documents processed")
+    num_questions: int = Field(..., validation_alias="numQuestionsTotal", description="Total number of questions")
+    started_at: datetime = Field(..., validation_alias="startedAt", description="Run start timestamp")
+    completed_at: Optional[datetime] = Field(None, validation_alias="completedAt", description="Run completion timestamp")
+    duration_seconds: Optional[float] = Field(None, validation_alias="durationSeconds", description="Total duration in seconds")
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def _lowercase_status(cls, value: str) -> str:
+        """Prisma stores statuses as upper-case enum values."""
+        return value.lower()
 
     class Config:
         from_attributes = True
+        frozen = True
+        populate_by_name = True
 
 
 class QuestionResult(BaseModel):
@@ -36,6 +48,7 @@ class QuestionResult(BaseModel):
 
     class Config:
         from_attributes = True
+        frozen = True
 
 
 class ProviderResult(BaseModel):
@@ -50,6 +63,7 @@ class ProviderResult(BaseModel):
 
     class Config:
         from_attributes = True
+        frozen = True
 
 
 class DocumentResult(BaseModel):
@@ -61,6 +75,7 @@ class DocumentResult(BaseModel):
 
     class Config:
         from_attributes = True
+        frozen = True
 
 
 class RunDetail(BaseModel):
@@ -82,6 +97,7 @@ class RunDetail(BaseModel):
 
     class Config:
         from_attributes = True
+        frozen = True
 
 
 class DatasetInfo(BaseModel):
@@ -13,6 +13,7 @@ from fastapi import APIRouter, Header, HTTPException, Depends
 from typing import Optional
 
 from api.models.benchmark import BenchmarkRequest, BenchmarkResponse
+from api.routers.results import invalidate_run_detail
 from src.core.orchestrator import Orchestrator
 
 logger = logging.getLogger(__name__)
@@ -112,6 +113,9 @@ async def create_benchmark(
         # Clean up temp file
         Path(config_path).unlink(missing_ok=True)
 
+        # A resumed run rewrites an existing run's results
+        invalidate_run_detail(result.run_id)
+
         logger.info(f"Benchmark completed: {run_id} ({result.duration_seconds:.1f}s)")
 
         return BenchmarkResponse(
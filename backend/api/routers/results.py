@@ -1,7 +1,12 @@
 """Results API router - read-only endpoints for benchmark results."""
 
-from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, Query
+import hashlib
+import time
+from collections import OrderedDict, defaultdict
+from typing import Optional, List, Tuple
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from prisma.partials import BenchmarkRunSummary
 from api.db import get_db, prisma
 from api.models.responses import (
     RunSummary,
@@ -19,6 +24,58 @@ from api.models.responses import (
 
 router = APIRouter()
 
+# Completed runs don't change, so their serialized detail payload is cached
+# in-process: run_id -> (expiry, etag, JSON body), least recently used evicted
+# first. Writers in this process call invalidate_run_detail(); the TTL bounds
+# how long a change made by another process (CLI re-run, migration) can be
+# served stale.
+_RUN_DETAIL_CACHE: "OrderedDict[str, Tuple[float, str, bytes]]" = OrderedDict()
+_RUN_DETAIL_CACHE_SIZE = 128
+_RUN_DETAIL_CACHE_TTL_SECONDS = 3600
+
+
+def invalidate_run_detail(run_id: str) -> None:
+    """Drop a run's cached detail payload (call after writing to the run)."""
+    _RUN_DETAIL_CACHE.pop(run_id, None)
+
+
+# Supported datasets - constant, so serialized once instead of per request
+_DATASETS = [
+    DatasetInfo(
+        name="qasper",
+        display_name="QASPER",
+        description="Question Answering on Scientific Papers - NLP research papers with questions",
+        available_splits=["train", "validation", "test"],
+        num_documents=1585,
+        task_type="question-answering",
+    ),
+    DatasetInfo(
+        name="policyqa",
+        display_name="PolicyQA",
+        description="Question answering on insurance policy documents",
+        available_splits=["train", "test"],
+        num_documents=None,  # TODO: Add actual count
+        task_type="question-answering",
+    ),
+    DatasetInfo(
+        name="squad2",
+        display_name="SQuAD 2.0",
+        description="Stanford Question Answering Dataset with unanswerable questions",
+        available_splits=["train", "validation"],
+        num_documents=None,  # TODO: Add actual count
+        task_type="question-answering",
+    ),
+]
+_DATASETS_JSON = orjson.dumps([d.model_dump(mode="json") for d in _DATASETS])
+
+
+def _run_detail_response(request: Request, etag: str, body: bytes) -> Response:
+    """Return a run detail body with its ETag, or 304 if the client already has it."""
+    headers = {"ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 @router.get("/results", response_model=ResultsListResponse)
 async def list_results(
@@ -43,8 +100,8 @@ async def list_results(
     if dataset:
         where["datasetName"] = dataset
 
-    # Query runs
-    runs = await prisma.benchmarkrun.find_many(
+    # Query runs (partial type selects only the columns RunSummary needs)
+    runs = await BenchmarkRunSummary.prisma(prisma).find_many(
         where=where,
         order={"completedAt": "desc"},
         skip=offset,
@@ -55,21 +112,7 @@ async def list_results(
     total = await prisma.benchmarkrun.count(where=where)
 
     # Convert to response model
-    run_summaries = [
-        RunSummary(
-            run_id=r.runId,
-            dataset=r.datasetName,
-            split=r.datasetSplit,
-            providers=r.providers,
-            status=r.status.lower(),
-            num_docs=r.numDocs,
-            num_questions=r.numQuestionsTotal,
-            started_at=r.startedAt,
-            completed_at=r.completedAt,
-            duration_seconds=r.durationSeconds,
-        )
-        for r in runs
-    ]
+    run_summaries = [RunSummary.model_validate(r) for r in runs]
 
     return ResultsListResponse(
         runs=run_summaries,
@@ -80,7 +123,7 @@ async def list_results(
 
 
 @router.get("/results/{run_id}", response_model=RunDetail)
-async def get_run_details(run_id: str, db=Depends(get_db)):
+async def get_run_details(run_id: str, request: Request, db=Depends(get_db)):
     """
     Get full details for a specific benchmark run.
 
@@ -93,8 +136,21 @@ async def get_run_details(run_id: str, db=Depends(get_db)):
     - All documents processed
     - Results from each provider
     - All questions with answers and scores
+
+    Completed runs are served from an in-process cache with an ETag.
     """
-    # Query run with all related data
+    cached = _RUN_DETAIL_CACHE.get(run_id)
+    if cached:
+        expires_at, etag, body = cached
+        if expires_at > time.monotonic():
+            _RUN_DETAIL_CACHE.move_to_end(run_id)
+            return _run_detail_response(request, etag, body)
+        del _RUN_DETAIL_CACHE[run_id]
+
+    # Query run with all related data. The engine loads each include level
+    # with one batched IN query (not one query per row); joined relation
+    # loading (relationLoadStrategy) needs Prisma 5.7+, newer than the
+    # engine bundled with prisma-client-py 0.11
     run = await prisma.benchmarkrun.find_unique(
         where={"runId": run_id},
         include={
@@ -111,19 +167,13 @@ async def get_run_details(run_id: str, db=Depends(get_db)):
         raise HTTPException(status_code=404, detail=f"Run '{run_id}' not found")
 
     # Group results by document
-    docs_map = {}
+    docs_map = defaultdict(lambda: {"doc_id": None, "doc_title": None, "providers": {}})
 
     for pr in run.providerResults:
         doc = pr.document
-        doc_id = doc.docId
-
-        # Create document entry if not exists
-        if doc_id not in docs_map:
-            docs_map[doc_id] = {
-                "doc_id": doc_id,
-                "doc_title": doc.docTitle,
-                "providers": {},
-            }
+        doc_entry = docs_map[doc.docId]
+        doc_entry["doc_id"] = doc.docId
+        doc_entry["doc_title"] = doc.docTitle
 
         # Build question results
         question_results = [
@@ -140,7 +190,7 @@ async def get_run_details(run_id: str, db=Depends(get_db)):
         ]
 
         # Add provider result
-        docs_map[doc_id]["providers"][pr.provider] = ProviderResult(
+        doc_entry["providers"][pr.provider] = ProviderResult(
             provider=pr.provider,
             status=pr.status.lower(),
             error=pr.error,
@@ -160,7 +210,7 @@ async def get_run_details(run_id: str, db=Depends(get_db)):
     ]
 
     # Build response
-    return RunDetail(
+    detail = RunDetail(
         run_id=run.runId,
         dataset=run.datasetName,
         split=run.datasetSplit,
@@ -176,6 +226,18 @@ async def get_run_details(run_id: str, db=Depends(get_db)):
         documents=documents,
     )
 
+    # Runs still in progress keep changing, so only cache finished ones
+    if run.status != "COMPLETED":
+        return detail
+
+    body = orjson.dumps(detail.model_dump(mode="json"))
+    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+    _RUN_DETAIL_CACHE[run_id] = (time.monotonic() + _RUN_DETAIL_CACHE_TTL_SECONDS, etag, body)
+    if len(_RUN_DETAIL_CACHE) > _RUN_DETAIL_CACHE_SIZE:
+        _RUN_DETAIL_CACHE.popitem(last=False)
+
+    return _run_detail_response(request, etag, body)
+
 
 @router.get("/datasets", response_model=List[DatasetInfo])
 async def list_datasets():
@@ -183,36 +245,9 @@ async def list_datasets():
     Get list of available datasets.
 
     Returns:
-    Static list of supported datasets with metadata.
+    Static list of supported datasets with metadata (serialized once at import).
     """
-    datasets = [
-        DatasetInfo(
-            name="qasper",
-            display_name="QASPER",
-            description="Question Answering on Scientific Papers - NLP research papers with questions",
-            available_splits=["train", "validation", "test"],
-            num_documents=1585,
-            task_type="question-answering",
-        ),
-        DatasetInfo(
-            name="policyqa",
-            display_name="PolicyQA",
-            description="Question answering on insurance policy documents",
-            available_splits=["train", "test"],
-            num_documents=None,  # TODO: Add actual count
-            task_type="question-answering",
-        ),
-        DatasetInfo(
-            name="squad2",
-            display_name="SQuAD 2.0",
-            description="Stanford Question Answering Dataset with unanswerable questions",
-            available_splits=["train", "validation"],
-            num_documents=None,  # TODO: Add actual count
-            task_type="question-answering",
-        ),
-    ]
-
-    return datasets
+    return Response(content=_DATASETS_JSON, media_type="application/json")
 
 
 @router.get("/datasets/{dataset_name}/documents", response_model=RunDetail)
@@ -420,7 +455,6 @@ async def get_dataset_performance(dataset_name: str, db=Depends(get_db)):
     total_documents = len(unique_docs)
 
     # Group by provider and aggregate
-    from collections import defaultdict
     import statistics
 
     provider_data = defaultdict(lambda: {
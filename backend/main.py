@@ -2,6 +2,8 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from api.db import lifespan
 from api.routers import results, benchmarks, parsing
 
@@ -11,6 +13,7 @@ app = FastAPI(
     version="1.0.0",
     description="API for browsing and triggering RAG benchmark results",
     lifespan=lifespan,  # Connect/disconnect Prisma on startup/shutdown
+    default_response_class=ORJSONResponse,  # C-accelerated JSON encoding
 )
 
 # Configure CORS for frontend access
@@ -22,6 +25,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON payloads (run details are highly repetitive)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Register routers
 app.include_router(results.router, prefix="/api/v1", tags=["results"])
 app.include_router(benchmarks.router, prefix="/api/v1/benchmarks", tags=["benchmarks"])
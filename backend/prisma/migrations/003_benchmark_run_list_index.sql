@@ -0,0 +1,2 @@
+-- CreateIndex
+CREATE INDEX "benchmark_runs_status_completed_at_id_idx" ON "benchmark_runs"("status", "completed_at" DESC, "id" DESC);
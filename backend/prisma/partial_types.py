@@ -0,0 +1,25 @@
+"""Partial model types generated alongside the Prisma client.
+
+Run by `prisma generate` (see `partial_type_generator` in schema.prisma).
+Partial types restrict the columns Prisma selects for a query.
+"""
+
+from prisma.models import BenchmarkRun
+
+# Columns needed by the results list view (RunSummary) - skips the large
+# `config` JSON and `errorMessage` columns
+BenchmarkRun.create_partial(
+    "BenchmarkRunSummary",
+    include=[
+        "runId",
+        "datasetName",
+        "datasetSplit",
+        "providers",
+        "status",
+        "numDocs",
+        "numQuestionsTotal",
+        "startedAt",
+        "completedAt",
+        "durationSeconds",
+    ],
+)
@@ -17,31 +17,28 @@ import asyncio
 import json
 import os
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 
 # Add parent directory to path to import from src
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from prisma import Prisma
+from prisma import Json, Prisma
 
+# A run's rows are written in one transaction; large runs take far longer
+# than Prisma's 5 second default
+MIGRATE_TX_TIMEOUT = timedelta(minutes=10)
 
-async def migrate_run(prisma: Prisma, run_dir: Path) -> Dict[str, Any]:
-    """Migrate a single benchmark run to the database."""
 
-    run_id = run_dir.name
-    print(f"\n{'='*80}")
-    print(f"Migrating run: {run_id}")
-    print(f"{'='*80}")
-
-    # Load run data
+def load_run(run_dir: Path) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Load a run's summary.json and config.json (None if there is no summary)."""
     summary_path = run_dir / "summary.json"
     config_path = run_dir / "config.json"
 
     if not summary_path.exists():
-        print(f"⚠️  Skipping {run_id}: No summary.json found")
-        return {"status": "skipped", "reason": "no_summary"}
+        print(f"⚠️  Skipping {run_dir.name}: No summary.json found")
+        return None
 
     with open(summary_path) as f:
         summary = json.load(f)
@@ -49,157 +46,213 @@ async def migrate_run(prisma: Prisma, run_dir: Path) -> Dict[str, Any]:
     with open(config_path) as f:
         config = json.load(f)
 
-    # Extract benchmark configuration
-    benchmark_config = config.get("benchmark", {})
-    dataset_config = benchmark_config.get("dataset", {})
+    return summary, config
 
-    # Parse timestamps from summary
-    started_at = datetime.fromisoformat(summary.get("timestamp_start", summary.get("timestamp", datetime.now().isoformat())))
-    completed_at = datetime.fromisoformat(summary.get("timestamp_end", started_at.isoformat())) if "timestamp_end" in summary else None
-
-    # Calculate duration
-    duration_seconds = summary.get("duration_seconds")
-    if duration_seconds is None and completed_at and started_at:
-        duration_seconds = (completed_at - started_at).total_seconds()
 
-    # Create BenchmarkRun record
-    print(f"Creating BenchmarkRun record...")
-    benchmark_run = await prisma.benchmarkrun.upsert(
-        where={"runId": run_id},
-        data={
-            "create": {
-                "runId": run_id,
-                "datasetName": dataset_config.get("name", summary.get("config", {}).get("benchmark", {}).get("dataset", {}).get("name", "unknown")),
-                "datasetSplit": dataset_config.get("split", summary.get("config", {}).get("benchmark", {}).get("dataset", {}).get("split", "train")),
-                "providers": summary.get("providers", []),
-                "numDocs": summary.get("num_docs", 0),
-                "numQuestionsTotal": summary.get("num_questions_total", 0),
-                "status": "COMPLETED",
-                "config": json.dumps(config),  # Serialize JSON for Prisma
-                "durationSeconds": duration_seconds,
-                "startedAt": started_at,
-                "completedAt": completed_at,
-            },
-            "update": {},  # Don't update if exists
-        }
+def run_dataset(summary: Dict[str, Any], config: Dict[str, Any]) -> Tuple[str, str]:
+    """Dataset (name, split) of a run, from config.json or the summary's copy of it."""
+    dataset_config = config.get("benchmark", {}).get("dataset", {})
+    summary_dataset = summary.get("config", {}).get("benchmark", {}).get("dataset", {})
+    return (
+        dataset_config.get("name", summary_dataset.get("name", "unknown")),
+        dataset_config.get("split", summary_dataset.get("split", "train")),
     )
-    print(f"✓ BenchmarkRun created: {benchmark_run.id}")
 
-    # Process each document
-    stats = {
-        "documents": 0,
-        "questions": 0,
-        "provider_results": 0,
-        "question_results": 0,
-    }
 
+async def upsert_shared_rows(
+    prisma: Prisma,
+    summary: Dict[str, Any],
+    dataset_name: str,
+    document_ids: Dict[Tuple[str, str], str],
+    question_ids: Dict[Tuple[str, str], str],
+) -> None:
+    """
+    Upsert the Document and Question rows a run refers to.
+
+    Runs of the same dataset share these rows, so they are upserted one run
+    at a time (never concurrently). Ids are added to document_ids
+    ({(docId, datasetName): id}) and question_ids ({(questionId, documentId): id});
+    rows already in the maps are not upserted again.
+    """
     for doc_result in summary.get("results", []):
-        doc_id = doc_result["doc_id"]
-        doc_title = doc_result["doc_title"]
-        dataset_name = benchmark_run.datasetName
-
-        print(f"\n  Processing document: {doc_id}")
-
-        # Upsert Document
-        document = await prisma.document.upsert(
-            where={
-                "docId_datasetName": {
-                    "docId": doc_id,
-                    "datasetName": dataset_name,
-                }
-            },
-            data={
-                "create": {
-                    "docId": doc_id,
-                    "datasetName": dataset_name,
-                    "docTitle": doc_title,
-                    "pdfPath": None,  # Will be populated later if needed
-                    "pdfUrl": None,
-                    "pdfSizeBytes": None,
-                    "metadata": json.dumps({}),
+        doc_key = (doc_result["doc_id"], dataset_name)
+        if doc_key not in document_ids:
+            document = await prisma.document.upsert(
+                where={
+                    "docId_datasetName": {
+                        "docId": doc_result["doc_id"],
+                        "datasetName": dataset_name,
+                    }
                 },
-                "update": {},  # Don't update if exists
-            }
-        )
-        stats["documents"] += 1
-        print(f"    ✓ Document: {document.id}")
-
-        # Process each provider's results for this document
-        for provider_name, provider_data in doc_result.get("providers", {}).items():
-            print(f"      Processing provider: {provider_name}")
-
-            # Parse timestamps
-            provider_started = None
-            provider_completed = None
-            if "timestamp_start" in provider_data:
-                provider_started = datetime.fromisoformat(provider_data["timestamp_start"])
-            if "timestamp_end" in provider_data:
-                provider_completed = datetime.fromisoformat(provider_data["timestamp_end"])
-
-            # Create ProviderResult
-            provider_result = await prisma.providerresult.create(
                 data={
-                    "runId": benchmark_run.id,
-                    "documentId": document.id,
-                    "provider": provider_name,
-                    "status": "SUCCESS" if provider_data.get("status") == "success" else "ERROR",
-                    "error": provider_data.get("error"),
-                    "indexId": provider_data.get("index_id"),
-                    "aggregatedScores": json.dumps(provider_data.get("aggregated_scores", {})),
-                    "durationSeconds": provider_data.get("duration_seconds"),
-                    "startedAt": provider_started,
-                    "completedAt": provider_completed,
+                    "create": {
+                        "docId": doc_result["doc_id"],
+                        "datasetName": dataset_name,
+                        "docTitle": doc_result["doc_title"],
+                        "pdfPath": None,  # Will be populated later if needed
+                        "pdfUrl": None,
+                        "pdfSizeBytes": None,
+                        "metadata": Json({}),
+                    },
+                    "update": {},  # Don't update if exists
                 }
             )
-            stats["provider_results"] += 1
-            print(f"        ✓ ProviderResult: {provider_result.id}")
+            document_ids[doc_key] = document.id
+        document_id = document_ids[doc_key]
 
-            # Process questions for this provider
+        for provider_data in doc_result.get("providers", {}).values():
             for question_data in provider_data.get("questions", []):
-                question_id = question_data["question_id"]
-
-                # Upsert Question
+                question_key = (question_data["question_id"], document_id)
+                if question_key in question_ids:
+                    continue
                 question = await prisma.question.upsert(
                     where={
                         "questionId_documentId": {
-                            "questionId": question_id,
-                            "documentId": document.id,
+                            "questionId": question_data["question_id"],
+                            "documentId": document_id,
                         }
                     },
                     data={
                         "create": {
-                            "questionId": question_id,
-                            "documentId": document.id,
+                            "questionId": question_data["question_id"],
+                            "documentId": document_id,
                             "question": question_data.get("question", ""),
                             "groundTruth": question_data.get("ground_truth", ""),
-                            "metadata": json.dumps({}),
+                            "metadata": Json({}),
                         },
                         "update": {},  # Don't update if exists
                     }
                 )
-                stats["questions"] += 1
+                question_ids[question_key] = question.id
 
-                # Create QuestionResult
-                await prisma.questionresult.create(
-                    data={
-                        "providerResultId": provider_result.id,
-                        "questionId": question.id,
-                        "responseAnswer": question_data.get("response_answer", ""),
-                        "responseContext": question_data.get("response_context", []),
-                        "responseLatencyMs": question_data.get("response_latency_ms"),
-                        "responseMetadata": json.dumps(question_data.get("response_metadata", {})),
-                        "evaluationScores": json.dumps(question_data.get("evaluation_scores", {})),
-                    }
-                )
-                stats["question_results"] += 1
 
-            print(f"        ✓ {len(provider_data.get('questions', []))} QuestionResults")
+async def migrate_run(
+    prisma: Prisma,
+    run_id: str,
+    summary: Dict[str, Any],
+    config: Dict[str, Any],
+    document_ids: Dict[Tuple[str, str], str],
+    question_ids: Dict[Tuple[str, str], str],
+) -> Dict[str, Any]:
+    """
+    Migrate a single benchmark run to the database.
+
+    Its Document and Question rows must already exist (see upsert_shared_rows).
+    All rows of the run are written in one transaction, so a failed run leaves
+    nothing behind and can simply be migrated again. Progress lines are
+    collected and printed together, so concurrent runs don't interleave.
+    """
+    lines = [f"\n{'='*80}", f"Migrating run: {run_id}", "="*80]
+
+    dataset_name, dataset_split = run_dataset(summary, config)
+
+    # Parse timestamps from summary
+    started_at = datetime.fromisoformat(summary.get("timestamp_start", summary.get("timestamp", datetime.now().isoformat())))
+    completed_at = datetime.fromisoformat(summary.get("timestamp_end", started_at.isoformat())) if "timestamp_end" in summary else None
+
+    # Calculate duration
+    duration_seconds = summary.get("duration_seconds")
+    if duration_seconds is None and completed_at and started_at:
+        duration_seconds = (completed_at - started_at).total_seconds()
 
-    print(f"\n  Summary for {run_id}:")
-    print(f"    Documents: {stats['documents']}")
-    print(f"    Questions: {stats['questions']}")
-    print(f"    ProviderResults: {stats['provider_results']}")
-    print(f"    QuestionResults: {stats['question_results']}")
+    stats = {
+        "documents": 0,
+        "questions": 0,
+        "provider_results": 0,
+        "question_results": 0,
+    }
+
+    try:
+        async with prisma.tx(timeout=MIGRATE_TX_TIMEOUT) as tx:
+            # Create BenchmarkRun record
+            lines.append("Creating BenchmarkRun record...")
+            benchmark_run = await tx.benchmarkrun.upsert(
+                where={"runId": run_id},
+                data={
+                    "create": {
+                        "runId": run_id,
+                        "datasetName": dataset_name,
+                        "datasetSplit": dataset_split,
+                        "providers": summary.get("providers", []),
+                        "numDocs": summary.get("num_docs", 0),
+                        "numQuestionsTotal": summary.get("num_questions_total", 0),
+                        "status": "COMPLETED",
+                        "config": Json(config),  # Prisma serializes JSON columns itself
+                        "durationSeconds": duration_seconds,
+                        "startedAt": started_at,
+                        "completedAt": completed_at,
+                    },
+                    "update": {},  # Don't update if exists
+                }
+            )
+            lines.append(f"✓ BenchmarkRun created: {benchmark_run.id}")
+
+            # Process each document
+            for doc_result in summary.get("results", []):
+                doc_id = doc_result["doc_id"]
+                document_id = document_ids[(doc_id, dataset_name)]
+
+                lines.append(f"\n  Processing document: {doc_id}")
+                stats["documents"] += 1
+                lines.append(f"    ✓ Document: {document_id}")
+
+                # Process each provider's results for this document
+                for provider_name, provider_data in doc_result.get("providers", {}).items():
+                    lines.append(f"      Processing provider: {provider_name}")
+
+                    # Parse timestamps
+                    provider_started = None
+                    provider_completed = None
+                    if "timestamp_start" in provider_data:
+                        provider_started = datetime.fromisoformat(provider_data["timestamp_start"])
+                    if "timestamp_end" in provider_data:
+                        provider_completed = datetime.fromisoformat(provider_data["timestamp_end"])
+
+                    # Create ProviderResult
+                    provider_result = await tx.providerresult.create(
+                        data={
+                            "runId": benchmark_run.id,
+                            "documentId": document_id,
+                            "provider": provider_name,
+                            "status": "SUCCESS" if provider_data.get("status") == "success" else "ERROR",
+                            "error": provider_data.get("error"),
+                            "indexId": provider_data.get("index_id"),
+                            "aggregatedScores": Json(provider_data.get("aggregated_scores", {})),
+                            "durationSeconds": provider_data.get("duration_seconds"),
+                            "startedAt": provider_started,
+                            "completedAt": provider_completed,
+                        }
+                    )
+                    stats["provider_results"] += 1
+                    lines.append(f"        ✓ ProviderResult: {provider_result.id}")
+
+                    # Process questions for this provider
+                    for question_data in provider_data.get("questions", []):
+                        stats["questions"] += 1
+
+                        # Create QuestionResult
+                        await tx.questionresult.create(
+                            data={
+                                "providerResultId": provider_result.id,
+                                "questionId": question_ids[(question_data["question_id"], document_id)],
+                                "responseAnswer": question_data.get("response_answer", ""),
+                                "responseContext": question_data.get("response_context", []),
+                                "responseLatencyMs": question_data.get("response_latency_ms"),
+                                "responseMetadata": Json(question_data.get("response_metadata", {})),
+                                "evaluationScores": Json(question_data.get("evaluation_scores", {})),
+                            }
+                        )
+                        stats["question_results"] += 1
+
+                    lines.append(f"        ✓ {len(provider_data.get('questions', []))} QuestionResults")
+
+        lines.append(f"\n  Summary for {run_id}:")
+        lines.append(f"    Documents: {stats['documents']}")
+        lines.append(f"    Questions: {stats['questions']}")
+        lines.append(f"    ProviderResults: {stats['provider_results']}")
+        lines.append(f"    QuestionResults: {stats['question_results']}")
+    finally:
+        print("\n".join(lines))
 
     return {"status": "success", "stats": stats}
 
@@ -233,22 +286,56 @@ async def main():
             "total_question_results": 0,
         }
 
+        def report_failure(run_id: str, error: BaseException) -> None:
+            print(f"\n❌ Error migrating {run_id}: {error}")
+            import traceback
+            traceback.print_exception(type(error), error, error.__traceback__)
+            total_stats["runs_failed"] += 1
+
+        # 1. Upsert the Document/Question rows shared between runs, one run at
+        # a time, so concurrent runs never race to create the same row
+        print("Upserting documents and questions...")
+        document_ids: Dict[Tuple[str, str], str] = {}
+        question_ids: Dict[Tuple[str, str], str] = {}
+        runs = []
         for run_dir in run_dirs:
             try:
-                result = await migrate_run(prisma, run_dir)
-                if result["status"] == "success":
-                    total_stats["runs_migrated"] += 1
-                    total_stats["total_documents"] += result["stats"]["documents"]
-                    total_stats["total_questions"] += result["stats"]["questions"]
-                    total_stats["total_provider_results"] += result["stats"]["provider_results"]
-                    total_stats["total_question_results"] += result["stats"]["question_results"]
-                elif result["status"] == "skipped":
+                loaded = load_run(run_dir)
+                if loaded is None:
                     total_stats["runs_skipped"] += 1
+                    continue
+                summary, config = loaded
+                dataset_name, _ = run_dataset(summary, config)
+                await upsert_shared_rows(prisma, summary, dataset_name, document_ids, question_ids)
+                runs.append((run_dir.name, summary, config))
             except Exception as e:
-                print(f"\n❌ Error migrating {run_dir.name}: {e}")
-                import traceback
-                traceback.print_exc()
-                total_stats["runs_failed"] += 1
+                report_failure(run_dir.name, e)
+        print(f"✓ {len(document_ids)} documents, {len(question_ids)} questions")
+
+        # 2. The per-run rows are independent, so migrate several runs at once
+        # (bounded to avoid exhausting the database connection pool)
+        semaphore = asyncio.Semaphore(int(os.getenv("MIGRATE_CONCURRENCY", "4")))
+
+        async def migrate_with_limit(run_id: str, summary: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await migrate_run(prisma, run_id, summary, config, document_ids, question_ids)
+
+        results = await asyncio.gather(
+            *(migrate_with_limit(*run) for run in runs),
+            return_exceptions=True,
+        )
+
+        for (run_id, _, _), result in zip(runs, results):
+            if isinstance(result, Exception):
+                report_failure(run_id, result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                total_stats["runs_migrated"] += 1
+                total_stats["total_documents"] += result["stats"]["documents"]
+                total_stats["total_questions"] += result["stats"]["questions"]
+                total_stats["total_provider_results"] += result["stats"]["provider_results"]
+                total_stats["total_question_results"] += result["stats"]["question_results"]
 
         # Print final summary
         print("\n" + "="*80)
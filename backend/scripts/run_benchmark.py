@@ -33,7 +33,10 @@ Examples:
 
 import sys
 import argparse
+import atexit
+import tempfile
 from pathlib import Path
+import yaml
 from dotenv import load_dotenv
 
 # Add project root to Python path
@@ -49,6 +52,34 @@ else:
 
 from src.core.orchestrator import Orchestrator
 
+# Prefer the libyaml C bindings when PyYAML was built with them
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+def load_yaml(stream):
+    """Parse YAML from a file object using the fastest safe loader."""
+    return yaml.load(stream, Loader=YAML_LOADER)
+
+
+def dump_yaml(data, stream):
+    """Write YAML to a file object using the fastest safe dumper."""
+    yaml.dump(data, stream, Dumper=YAML_DUMPER)
+
+
+def load_config(config_path: Path) -> dict:
+    """
+    Load a YAML config file.
+
+    Args:
+        config_path: Path to the YAML config file
+
+    Returns:
+        Parsed config dict
+    """
+    with open(config_path) as f:
+        return load_yaml(f)
+
 
 def parse_args():
     """Parse command-line arguments."""
@@ -97,7 +128,7 @@ def parse_args():
     parser.add_argument(
         '--workers',
         type=int,
-        help='Max concurrent provider workers (overrides config)'
+        help='Max concurrent (provider, document) tasks (overrides config)'
     )
 
     # Resume capability
@@ -165,7 +196,7 @@ def override_config(config: dict, args: argparse.Namespace) -> dict:
 
     # Execution overrides
     if args.workers:
-        benchmark_config['execution']['max_provider_workers'] = args.workers
+        benchmark_config['execution']['max_total_workers'] = args.workers
 
     # Output overrides
     if args.output_dir:
@@ -202,9 +233,7 @@ def main():
     print(f"Config: {config_path}")
 
     # Load and override config
-    import yaml
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
+    config = load_config(config_path)
 
     # Apply command-line overrides
     if any([args.dataset, args.docs, args.questions, args.providers,
@@ -228,10 +257,11 @@ def main():
         config = override_config(config, args)
 
         # Save modified config to temp file
-        temp_config_path = Path('.ragrace_temp_config.yaml')
-        with open(temp_config_path, 'w') as f:
-            yaml.dump(config, f)
-        config_path = temp_config_path
+        # (system temp dir, usually tmpfs; removed on exit even if interrupted)
+        with tempfile.NamedTemporaryFile('w', prefix='ragrace_config_', suffix='.yaml', delete=False) as f:
+            dump_yaml(config, f)
+        config_path = Path(f.name)
+        atexit.register(config_path.unlink, missing_ok=True)
 
     # Run benchmark
     try:
@@ -246,10 +276,6 @@ def main():
 
         summary = orchestrator.run_benchmark()
 
-        # Cleanup temp config if created
-        if config_path.name == '.ragrace_temp_config.yaml':
-            config_path.unlink()
-
         print(f"\n✅ Benchmark completed successfully!")
         print(f"   Results: {orchestrator.result_saver.run_dir}")
 
@@ -5,6 +5,7 @@ Test script to verify Prisma queries and data integrity after migration.
 
 import asyncio
 import sys
+from collections import defaultdict
 from pathlib import Path
 
 # Add parent directory to path
@@ -24,43 +25,54 @@ async def main():
     await prisma.connect()
 
     try:
-        # Test 1: Count benchmark runs
-        print("\n1. Counting benchmark runs...")
-        runs_count = await prisma.benchmarkrun.count()
+        # Tests 1, 2, 4 and 5 are independent reads - run them concurrently
+        count_rows, runs, providers, datasets = await asyncio.gather(
+            prisma.query_raw(
+                """
+                SELECT
+                    (SELECT count(*) FROM benchmark_runs) AS runs,
+                    (SELECT count(*) FROM documents) AS docs,
+                    (SELECT count(*) FROM questions) AS questions,
+                    (SELECT count(*) FROM provider_results) AS provider_results,
+                    (SELECT count(*) FROM question_results) AS question_results
+                """
+            ),
+            prisma.benchmarkrun.find_many(
+                order={'createdAt': 'desc'},
+                take=5
+            ),
+            prisma.providerresult.group_by(
+                by=['provider', 'status'],
+                count=True
+            ),
+            prisma.benchmarkrun.group_by(
+                by=['datasetName'],
+                count=True
+            ),
+        )
+
+        # Test 1: Count records in every table (one round-trip)
+        print("\n1. Counting records...")
+        counts = count_rows[0]
+        runs_count = counts['runs']
+        docs_count = counts['docs']
+        questions_count = counts['questions']
+        provider_results_count = counts['provider_results']
+        question_results_count = counts['question_results']
         print(f"   ✓ Found {runs_count} benchmark runs")
+        print(f"   ✓ Found {docs_count} unique documents")
+        print(f"   ✓ Found {questions_count} unique questions")
+        print(f"   ✓ Found {provider_results_count} provider results")
+        print(f"   ✓ Found {question_results_count} question results")
 
         # Test 2: Query all runs
         print("\n2. Querying all benchmark runs...")
-        runs = await prisma.benchmarkrun.find_many(
-            order={'createdAt': 'desc'},
-            take=5
-        )
         print(f"   ✓ Retrieved {len(runs)} runs (showing top 5):")
         for run in runs:
             print(f"      - {run.runId}: {run.datasetName} ({run.status})")
 
-        # Test 3: Count documents
-        print("\n3. Counting documents...")
-        docs_count = await prisma.document.count()
-        print(f"   ✓ Found {docs_count} unique documents")
-
-        # Test 4: Count questions
-        print("\n4. Counting questions...")
-        questions_count = await prisma.question.count()
-        print(f"   ✓ Found {questions_count} unique questions")
-
-        # Test 5: Count provider results
-        print("\n5. Counting provider results...")
-        provider_results_count = await prisma.providerresult.count()
-        print(f"   ✓ Found {provider_results_count} provider results")
-
-        # Test 6: Count question results
-        print("\n6. Counting question results...")
-        question_results_count = await prisma.questionresult.count()
-        print(f"   ✓ Found {question_results_count} question results")
-
-        # Test 7: Query with relations
-        print("\n7. Testing nested query with relations...")
+        # Test 3: Query with relations
+        print("\n3. Testing nested query with relations...")
         run_with_relations = await prisma.benchmarkrun.find_first(
             where={'status': 'COMPLETED'},
             include={
@@ -86,35 +98,32 @@ async def main():
                 print(f"      - Document: {pr.document.docTitle[:50]}...")
                 print(f"      - Question results: {len(pr.questionResults)}")
 
-        # Test 8: Test aggregations
-        print("\n8. Testing aggregations by provider...")
-        providers = await prisma.providerresult.group_by(
-            by=['provider'],
-            count=True
-        )
+        # Test 4: Test aggregations
+        print("\n4. Testing aggregations by provider...")
+        # One (provider, status) grouping gives both totals and the status split
+        provider_status_counts = defaultdict(dict)
+        for row in providers:
+            provider_status_counts[row['provider']][row['status']] = row['_count']['_all']
         print(f"   ✓ Results by provider:")
-        for p in providers:
-            print(f"      - {p['provider']}: {p['_count']} results")
-
-        # Test 9: Test dataset distribution
-        print("\n9. Testing dataset distribution...")
-        datasets = await prisma.benchmarkrun.group_by(
-            by=['datasetName'],
-            count=True
-        )
+        for provider, status_counts in provider_status_counts.items():
+            breakdown = ", ".join(f"{count} {status.lower()}" for status, count in sorted(status_counts.items()))
+            print(f"      - {provider}: {sum(status_counts.values())} results ({breakdown})")
+
+        # Test 5: Test dataset distribution
+        print("\n5. Testing dataset distribution...")
         print(f"   ✓ Runs by dataset:")
         for d in datasets:
-            print(f"      - {d['datasetName']}: {d['_count']} runs")
+            print(f"      - {d['datasetName']}: {d['_count']['_all']} runs")
 
-        # Test 10: Verify JSON deserialization
-        print("\n10. Testing JSON field deserialization...")
+        # Test 6: Verify JSON deserialization
+        print("\n6. Testing JSON field deserialization...")
         result_with_json = await prisma.questionresult.find_first(
             where={'evaluationScores': {'not': '{}'}}
         )
         if result_with_json:
-            import json
             # Prisma automatically deserializes JSON fields
-            eval_scores = json.loads(result_with_json.evaluationScores) if isinstance(result_with_json.evaluationScores, str) else result_with_json.evaluationScores
+            eval_scores = result_with_json.evaluationScores
+            assert isinstance(eval_scores, dict), f"Expected dict, got {type(eval_scores).__name__}"
             print(f"   ✓ Evaluation scores successfully deserialized:")
             for metric, score in list(eval_scores.items())[:3]:
                 print(f"      - {metric}: {score}")
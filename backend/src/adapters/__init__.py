@@ -3,12 +3,21 @@ RAG Provider Adapters.
 
 This module provides adapters for different RAG providers,
 all implementing the BaseAdapter interface.
+
+Provider adapters are imported lazily (PEP 562) so that importing this
+package - e.g. for the parsing adapters - does not load every provider SDK.
 """
 
+import importlib
+
 from src.adapters.base import BaseAdapter, Document, RAGResponse
-from src.adapters.llamaindex_adapter import LlamaIndexAdapter
-from src.adapters.landingai_adapter import LandingAIAdapter
-from src.adapters.reducto_adapter import ReductoAdapter
+
+# Lazily imported adapters: attribute name -> defining module
+_LAZY_ADAPTERS = {
+    "LlamaIndexAdapter": "src.adapters.llamaindex_adapter",
+    "LandingAIAdapter": "src.adapters.landingai_adapter",
+    "ReductoAdapter": "src.adapters.reducto_adapter",
+}
 
 __all__ = [
     "BaseAdapter",
@@ -18,3 +27,15 @@ __all__ = [
     "LandingAIAdapter",
     "ReductoAdapter",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_ADAPTERS:
+        adapter = getattr(importlib.import_module(_LAZY_ADAPTERS[name]), name)
+        globals()[name] = adapter  # Cache so later lookups skip __getattr__
+        return adapter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ADAPTERS))
@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Document:
     """Standardized document format for RAG ingestion."""
     id: str
@@ -18,7 +18,7 @@ class Document:
     metadata: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RAGResponse:
     """Standardized response format from RAG queries."""
     answer: str
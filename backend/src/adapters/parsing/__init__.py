@@ -1,5 +1,5 @@
 """Make parsing adapters a package."""
 
-from .base import BaseParseAdapter, PageResult, ParseResult
+from .base import BaseParseAdapter, BatchParseResult, PageResult, ParseResult
 
-__all__ = ["BaseParseAdapter", "PageResult", "ParseResult"]
+__all__ = ["BaseParseAdapter", "BatchParseResult", "PageResult", "ParseResult"]
@@ -1,12 +1,50 @@
 """Base adapter interface for PDF parsing."""
 
+import asyncio
+import functools
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Tuple, TypeVar
 
+# Set RAGRACE_PARSE_DEBUG=1 to dump raw provider responses to data/temp
+PARSE_DEBUG = os.getenv("RAGRACE_PARSE_DEBUG") == "1"
 
-@dataclass
+# Threads per provider for blocking SDK calls. Each call holds its thread for
+# the whole vendor round-trip (minutes for large PDFs), so providers get their
+# own pools rather than sharing the loop's small default executor.
+_PROVIDER_THREADS = {"landingai": 32, "reducto": 16}
+_DEFAULT_PROVIDER_THREADS = 16
+_provider_executors: Dict[str, ThreadPoolExecutor] = {}
+
+T = TypeVar("T")
+
+
+async def run_blocking(provider: str, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking provider SDK call in that provider's thread pool.
+
+    Args:
+        provider: Provider name (selects the thread pool)
+        func: Blocking callable
+        *args, **kwargs: Arguments for func
+
+    Returns:
+        Whatever func returns
+    """
+    executor = _provider_executors.get(provider)
+    if executor is None:
+        executor = _provider_executors[provider] = ThreadPoolExecutor(
+            max_workers=_PROVIDER_THREADS.get(provider, _DEFAULT_PROVIDER_THREADS),
+            thread_name_prefix=f"parse-{provider}",
+        )
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+
+@dataclass(slots=True, frozen=True)
 class PageResult:
     """Result for a single page of parsed content."""
 
@@ -16,7 +54,7 @@ class PageResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)  # Not frozen: the parsing API fills in usage after pricing
 class ParseResult:
     """Complete parsing result from a provider."""
 
@@ -28,6 +66,14 @@ class ParseResult:
     usage: Dict[str, Any] = field(default_factory=dict)  # Credits, model info, etc.
 
 
+@dataclass(slots=True)
+class BatchParseResult:
+    """Outcome of parsing several PDFs, with failures kept per file."""
+
+    successful: List[Tuple[Path, ParseResult]] = field(default_factory=list)
+    failed: List[Tuple[Path, Exception]] = field(default_factory=list)
+
+
 class BaseParseAdapter(ABC):
     """Abstract base class for PDF parsing adapters."""
 
@@ -43,3 +89,38 @@ class BaseParseAdapter(ABC):
             ParseResult containing page-by-page markdown and metadata
         """
         pass
+
+    async def parse_batch(self, pdf_paths: List[Path], concurrency: int = 4) -> BatchParseResult:
+        """
+        Parse several PDFs concurrently, collecting failures instead of raising.
+
+        One bad PDF does not cancel the others.
+
+        Args:
+            pdf_paths: Paths to the PDF files
+            concurrency: Max PDFs in flight at once (keeps within provider rate limits)
+
+        Returns:
+            BatchParseResult with (path, result) and (path, error) pairs, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def parse_one(pdf_path: Path) -> ParseResult:
+            async with semaphore:
+                return await self.parse_pdf(pdf_path)
+
+        results = await asyncio.gather(
+            *(parse_one(pdf_path) for pdf_path in pdf_paths),
+            return_exceptions=True,
+        )
+
+        batch = BatchParseResult()
+        for pdf_path, result in zip(pdf_paths, results):
+            if isinstance(result, Exception):
+                batch.failed.append((pdf_path, result))
+            elif isinstance(result, BaseException):
+                # Cancellation (or KeyboardInterrupt/SystemExit) is not a parse failure
+                raise result
+            else:
+                batch.successful.append((pdf_path, result))
+        return batch
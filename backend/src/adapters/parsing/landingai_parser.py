@@ -1,15 +1,37 @@
 """LandingAI parsing adapter."""
 
-import os
 import re
 import time
 from pathlib import Path
 from typing import Dict, Any, List, Union
-from collections import defaultdict
 
 from landingai_ade import LandingAIADE
 
-from .base import BaseParseAdapter, PageResult, ParseResult
+from .base import BaseParseAdapter, PageResult, ParseResult, run_blocking
+
+# Patterns used by LandingAIParser._normalize_markdown (compiled once per process)
+_TABLE_RE = re.compile(r'<table[^>]*>.*?</table>', re.DOTALL)
+_TABLE_ID_RE = re.compile(r'<table[^>]*id=["\']([^"\']+)["\'][^>]*>')
+_TR_RE = re.compile(r'<tr[^>]*>.*?</tr>', re.DOTALL)
+_TD_RE = re.compile(r'<td([^>]*)>(.*?)</td>')
+
+_ANCHOR_RE = re.compile(r'<a id=["\'][\w\-]+["\']></a>\s*')
+
+_PAGE_MARKER_RE = re.compile(r'Page \| \d+\s*')
+_COPYRIGHT_RE = re.compile(r'Copyright ©\d{4}[^\n]*\n*')
+_BLANK_LINES_RE = re.compile(r'\n\n\n+')
+
+# Error messages that mean "try the next API key": quota/credit exhaustion,
+# rate limits and invalid/expired keys (matched in a single scan)
+_RETRYABLE_ERROR_RE = re.compile(
+    r"quota|credit|rate limit|insufficient|exceeded"
+    r"|invalid|expired|unauthorized"  # Invalid/expired API key, auth failures
+    r"|401|429|402",  # HTTP Unauthorized, Too Many Requests, Payment Required
+    re.IGNORECASE,
+)
+
+# Substrings that signal _normalize_markdown has something to rewrite
+_NORMALIZE_MARKERS = ('<table', '<a id=', 'Page | ', 'Copyright ©', '\n\n\n')
 
 
 class LandingAIParser(BaseParseAdapter):
@@ -40,6 +62,14 @@ class LandingAIParser(BaseParseAdapter):
         self.model = model
         self.credits_per_page = credits_per_page
         self.current_key_index = 0  # Track which key we're currently using
+        self._clients: Dict[str, LandingAIADE] = {}  # One client (and connection pool) per key
+
+    def _client_for(self, api_key: str) -> LandingAIADE:
+        """Return the cached LandingAI client for an API key, creating it on first use."""
+        client = self._clients.get(api_key)
+        if client is None:
+            client = self._clients[api_key] = LandingAIADE(apikey=api_key)
+        return client
 
     def _is_retryable_error(self, error: Exception) -> bool:
         """
@@ -51,26 +81,10 @@ class LandingAIParser(BaseParseAdapter):
         Returns:
             True if the error indicates we should try the next API key
         """
-        error_msg = str(error).lower()
-
-        # Common patterns for retryable errors (quota, credit, invalid/expired keys)
-        retryable_patterns = [
-            "quota",
-            "credit",
-            "rate limit",
-            "insufficient",
-            "exceeded",
-            "invalid",  # Invalid API key
-            "expired",  # Expired API key
-            "unauthorized",  # Auth failures
-            "401",  # HTTP 401 Unauthorized (invalid/expired key)
-            "429",  # HTTP 429 Too Many Requests
-            "402",  # HTTP 402 Payment Required
-        ]
-
-        return any(pattern in error_msg for pattern in retryable_patterns)
+        return _RETRYABLE_ERROR_RE.search(str(error)) is not None
 
-    def _normalize_markdown(self, markdown: str) -> str:
+    @staticmethod
+    def _normalize_markdown(markdown: str) -> str:
         """
         Post-process LandingAI markdown for fairer comparison with other providers.
 
@@ -89,54 +103,52 @@ class LandingAIParser(BaseParseAdapter):
         if not markdown:
             return markdown
 
+        # Fast path: plain text only needs trimming
+        if not any(marker in markdown for marker in _NORMALIZE_MARKERS):
+            return markdown.strip()
+
         # 1. Remove anchor tags: <a id='...'></a>
-        markdown = re.sub(r'<a id=["\'][\w\-]+["\']></a>\s*', '', markdown)
+        markdown = _ANCHOR_RE.sub('', markdown)
 
         # 2. Improve table structure
-        # Find all tables and enhance them
-        def enhance_table(match):
-            table_content = match.group(0)
-
-            # Extract table ID if present
-            table_id_match = re.search(r'<table[^>]*id=["\']([^"\']+)["\'][^>]*>', table_content)
-            table_id = f' id="{table_id_match.group(1)}"' if table_id_match else ''
+        # Walk the tables left to right, copying the text between them as-is
+        parts = []
+        last_end = 0
+        for table_match in _TABLE_RE.finditer(markdown):
+            table_content = table_match.group(0)
 
             # Split into rows
-            rows = re.findall(r'<tr[^>]*>.*?</tr>', table_content, re.DOTALL)
+            rows = _TR_RE.findall(table_content)
 
             if not rows:
-                return table_content
+                continue  # Left untouched (copied with the surrounding text)
+
+            # Extract table ID if present (anchored at the opening tag)
+            table_id_match = _TABLE_ID_RE.match(table_content)
+            table_id = f' id="{table_id_match.group(1)}"' if table_id_match else ''
 
             # First row becomes header (convert <td> to <th>)
-            first_row = rows[0]
-            header_row = re.sub(
-                r'<td([^>]*)>(.*?)</td>',
-                r'<th\1>\2</th>',
-                first_row
-            )
+            header_row = _TD_RE.sub(r'<th\1>\2</th>', rows[0])
 
             # Build new table with proper structure
-            enhanced = f'<table{table_id}>\n<thead>\n{header_row}\n</thead>\n<tbody>\n'
-            enhanced += '\n'.join(rows[1:])
-            enhanced += '\n</tbody>\n</table>'
+            parts.append(markdown[last_end:table_match.start()])
+            parts.append(f'<table{table_id}>\n<thead>\n{header_row}\n</thead>\n<tbody>\n')
+            parts.append('\n'.join(rows[1:]))
+            parts.append('\n</tbody>\n</table>')
+            last_end = table_match.end()
 
-            return enhanced
-
-        markdown = re.sub(
-            r'<table[^>]*>.*?</table>',
-            enhance_table,
-            markdown,
-            flags=re.DOTALL
-        )
+        if parts:
+            parts.append(markdown[last_end:])
+            markdown = ''.join(parts)
 
         # 3. Remove "Page | N" markers (they're redundant - we track pages separately)
-        markdown = re.sub(r'Page \| \d+\s*', '', markdown)
+        markdown = _PAGE_MARKER_RE.sub('', markdown)
 
         # 4. Remove copyright notices that appear on every page
-        markdown = re.sub(r'Copyright ©\d{4}[^\n]*\n*', '', markdown)
+        markdown = _COPYRIGHT_RE.sub('', markdown)
 
         # 5. Clean up excessive whitespace
-        markdown = re.sub(r'\n\n\n+', '\n\n', markdown)
+        markdown = _BLANK_LINES_RE.sub('\n\n', markdown)
         markdown = markdown.strip()
 
         return markdown
@@ -156,16 +168,23 @@ class LandingAIParser(BaseParseAdapter):
             Exception: If all API keys fail or if a non-retryable error occurs
         """
         start_time = time.time()
-        last_error = None
 
-        # Try each API key in sequence
-        for key_index, api_key in enumerate(self.api_keys):
-            try:
-                # Initialize LandingAI client with current key
-                client = LandingAIADE(apikey=api_key)
+        # Try each API key in sequence, starting from the last key that worked
+        # so keys already known to be exhausted don't cost a round-trip per parse
+        num_keys = len(self.api_keys)
+        key_order = [(self.current_key_index + offset) % num_keys for offset in range(num_keys)]
 
-                # Parse the PDF using configured model
-                parse_response = client.parse(
+        for attempt, key_index in enumerate(key_order):
+            api_key = self.api_keys[key_index]
+            try:
+                # Reuse the LandingAI client for the current key
+                client = self._client_for(api_key)
+
+                # Parse the PDF using configured model (the SDK call blocks,
+                # so run it in a worker thread to keep the event loop free)
+                parse_response = await run_blocking(
+                    "landingai",
+                    client.parse,
                     document=pdf_path,
                     model=self.model,
                 )
@@ -175,20 +194,20 @@ class LandingAIParser(BaseParseAdapter):
                 break
 
             except Exception as e:
-                last_error = e
                 error_msg = str(e)
 
                 # Check if this is a retryable error
                 if self._is_retryable_error(e):
                     # Try next key if available
-                    if key_index < len(self.api_keys) - 1:
+                    if attempt < num_keys - 1:
+                        next_key_index = key_order[attempt + 1]
                         print(f"LandingAI API key {key_index + 1} failed: {error_msg}")
-                        print(f"  → Trying next API key ({key_index + 2}/{len(self.api_keys)})...")
+                        print(f"  → Trying next API key ({next_key_index + 1}/{num_keys})...")
                         continue
                     else:
                         # No more keys to try
                         raise Exception(
-                            f"All {len(self.api_keys)} LandingAI API keys exhausted. Last error: {error_msg}"
+                            f"All {num_keys} LandingAI API keys exhausted. Last error: {error_msg}"
                         ) from e
                 else:
                     # Non-retryable error (e.g., network issue, malformed request)
@@ -196,71 +215,59 @@ class LandingAIParser(BaseParseAdapter):
                         f"LandingAI API key {key_index + 1} failed with non-retryable error: {error_msg}"
                     ) from e
 
-        # If we got here without a parse_response, something went wrong
-        if last_error and 'parse_response' not in locals():
-            raise last_error
-
-        # Convert response to dict if it's not already
-        if hasattr(parse_response, 'dict'):
-            response_data = parse_response.dict()
-        elif hasattr(parse_response, 'model_dump'):
-            response_data = parse_response.model_dump()
-        elif isinstance(parse_response, dict):
-            response_data = parse_response
+        # Pull out only the chunks and metadata. A full model_dump() would
+        # also copy the document-level markdown, splits and grounding map.
+        if isinstance(parse_response, dict):
+            metadata = parse_response.get("metadata", {})
+            chunks = parse_response.get("chunks", [])
+            total_chunks = len(chunks)
         else:
-            # Try to convert to dict
-            response_data = dict(parse_response)
+            metadata = parse_response.metadata.model_dump() if parse_response.metadata else {}
+            total_chunks = len(parse_response.chunks)
+            # Dump chunks one at a time while grouping them, rather than
+            # holding a dict copy of every chunk alongside the response
+            chunks = (chunk.model_dump() for chunk in parse_response.chunks)
 
-        # Extract metadata
-        metadata = response_data.get("metadata", {})
         total_pages = metadata.get("page_count", 1)
 
-        # Group chunks by page number
-        chunks = response_data.get("chunks", [])
-        page_chunks = defaultdict(list)
+        # Group chunk markdown and metadata by page in a single pass
+        # (list index = LandingAI's 0-based page number)
+        page_markdown_parts = [[] for _ in range(total_pages)]
+        page_chunk_metadata = [[] for _ in range(total_pages)]
 
         for chunk in chunks:
-            grounding = chunk.get("grounding", {})
-            # LandingAI uses 0-based page indexing, convert to 1-based
-            page_num_api = grounding.get("page", 0)  # API returns 0, 1, 2...
-            page_num = page_num_api + 1  # Convert to 1, 2, 3...
-            page_chunks[page_num].append(chunk)
-
-        # Create PageResult for each page
-        pages = []
-        for page_num in range(1, total_pages + 1):
-            # Combine markdown from all chunks on this page
-            chunks_on_page = page_chunks.get(page_num, [])
-            markdown_parts = [chunk.get("markdown", "") for chunk in chunks_on_page]
-            combined_markdown = "\n\n".join(filter(None, markdown_parts))
-
-            # If no chunks for this page, use empty string
-            if not combined_markdown and page_num not in page_chunks:
-                combined_markdown = ""
-
-            # Normalize/clean markdown for fairer comparison
-            combined_markdown = self._normalize_markdown(combined_markdown)
-
-            # Collect chunk metadata
-            chunk_metadata = []
-            for chunk in chunks_on_page:
-                chunk_metadata.append({
-                    "type": chunk.get("type"),
-                    "id": chunk.get("id"),
-                    "grounding": chunk.get("grounding"),
-                })
-
-            pages.append(
-                PageResult(
-                    page_number=page_num,
-                    markdown=combined_markdown,
-                    images=[],  # LandingAI doesn't provide separate image URLs
-                    metadata={
-                        "chunks": chunk_metadata,
-                        "chunk_count": len(chunks_on_page),
-                    },
+            grounding = chunk.get("grounding")
+            page_index = (grounding or {}).get("page", 0)  # API returns 0, 1, 2...
+            if 0 <= page_index < total_pages:
+                if markdown := chunk.get("markdown"):
+                    page_markdown_parts[page_index].append(markdown)
+                page_chunk_metadata[page_index].append(
+                    {
+                        "type": chunk.get("type"),
+                        "id": chunk.get("id"),
+                        "grounding": grounding,
+                    }
                 )
+
+        # Combine markdown from all chunks on each page
+        page_markdowns = ["\n\n".join(parts) for parts in page_markdown_parts]
+
+        # Normalize/clean markdown for fairer comparison
+        page_markdowns = [self._normalize_markdown(markdown) for markdown in page_markdowns]
+
+        # Create PageResult for each page (1-based page numbers)
+        pages = [
+            PageResult(
+                page_number=page_index + 1,
+                markdown=page_markdowns[page_index],
+                images=[],  # LandingAI doesn't provide separate image URLs
+                metadata={
+                    "chunks": chunk_metadata,
+                    "chunk_count": len(chunk_metadata),
+                },
             )
+            for page_index, chunk_metadata in enumerate(page_chunk_metadata)
+        ]
 
         # Calculate processing time
         duration_ms = metadata.get("duration_ms", 0)
@@ -271,7 +278,10 @@ class LandingAIParser(BaseParseAdapter):
             provider="landingai",
             total_pages=total_pages,
             pages=pages,
-            raw_response=response_data,
+            raw_response={
+                "metadata": metadata,
+                "total_chunks": total_chunks,
+            },
             processing_time=processing_time,
             usage={
                 "num_pages": total_pages,
@@ -1,5 +1,7 @@
 """LlamaIndex (LlamaParse) parsing adapter."""
 
+import asyncio
+import json
 import os
 import time
 from pathlib import Path
@@ -7,7 +9,7 @@ from typing import Dict, Any
 
 from llama_parse import LlamaParse
 
-from .base import BaseParseAdapter, PageResult, ParseResult
+from .base import PARSE_DEBUG, BaseParseAdapter, PageResult, ParseResult
 
 
 class LlamaIndexParser(BaseParseAdapter):
@@ -64,34 +66,10 @@ class LlamaIndexParser(BaseParseAdapter):
         # Parse the PDF (async)
         result = await parser.aparse(str(pdf_path))
 
-        # Debug: Save the raw result to see its structure (optional, only if temp dir exists)
-        import json
-        try:
-            temp_dir = Path("data/temp")
-            if temp_dir.exists():
-                debug_file = temp_dir / "llamaparse_debug.json"
-                # Try to serialize result for inspection
-                debug_data = {
-                    "type": str(type(result)),
-                    "dir": [x for x in dir(result) if not x.startswith('_')],
-                    "pages_type": str(type(result.pages)) if hasattr(result, 'pages') else None,
-                    "pages_length": len(result.pages) if hasattr(result, 'pages') else None,
-                }
-                if hasattr(result, 'pages') and len(result.pages) > 0:
-                    first_page = result.pages[0]
-                    debug_data["first_page_type"] = str(type(first_page))
-                    debug_data["first_page_dir"] = [x for x in dir(first_page) if not x.startswith('_')]
-                    debug_data["first_page_md"] = str(first_page.md) if hasattr(first_page, 'md') else None
-                    debug_data["first_page_images_type"] = str(type(first_page.images)) if hasattr(first_page, 'images') else None
-                    if hasattr(first_page, 'images') and first_page.images:
-                        debug_data["first_image_type"] = str(type(first_page.images[0]))
-                        debug_data["first_image_dir"] = [x for x in dir(first_page.images[0]) if not x.startswith('_')]
-
-                with open(debug_file, 'w') as f:
-                    json.dump(debug_data, f, indent=2)
-        except Exception as e:
-            # Silently ignore debug file errors
-            pass
+        # Debug: Save the raw result to see its structure (opt-in, only if temp dir exists;
+        # written from a worker thread so the file I/O doesn't block the loop)
+        if PARSE_DEBUG:
+            await asyncio.to_thread(self._dump_debug_result, result)
 
         # Extract page-by-page markdown
         pages = []
@@ -139,3 +117,33 @@ class LlamaIndexParser(BaseParseAdapter):
                 "num_pages": len(pages),
             },
         )
+
+    @staticmethod
+    def _dump_debug_result(result: Any) -> None:
+        """Write a summary of the raw LlamaParse result to data/temp for inspection."""
+        try:
+            temp_dir = Path("data/temp")
+            if temp_dir.exists():
+                debug_file = temp_dir / "llamaparse_debug.json"
+                # Try to serialize result for inspection
+                debug_data = {
+                    "type": str(type(result)),
+                    "dir": [x for x in dir(result) if not x.startswith('_')],
+                    "pages_type": str(type(result.pages)) if hasattr(result, 'pages') else None,
+                    "pages_length": len(result.pages) if hasattr(result, 'pages') else None,
+                }
+                if hasattr(result, 'pages') and len(result.pages) > 0:
+                    first_page = result.pages[0]
+                    debug_data["first_page_type"] = str(type(first_page))
+                    debug_data["first_page_dir"] = [x for x in dir(first_page) if not x.startswith('_')]
+                    debug_data["first_page_md"] = str(first_page.md) if hasattr(first_page, 'md') else None
+                    debug_data["first_page_images_type"] = str(type(first_page.images)) if hasattr(first_page, 'images') else None
+                    if hasattr(first_page, 'images') and first_page.images:
+                        debug_data["first_image_type"] = str(type(first_page.images[0]))
+                        debug_data["first_image_dir"] = [x for x in dir(first_page.images[0]) if not x.startswith('_')]
+
+                with open(debug_file, 'w') as f:
+                    json.dump(debug_data, f, indent=2)
+        except Exception:
+            # Silently ignore debug file errors
+            pass
@@ -1,14 +1,22 @@
 """Reducto parsing adapter with chunk-to-page mapping."""
 
-import os
+import asyncio
+import json
 import time
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 
-from reducto import Reducto
+from .base import PARSE_DEBUG, BaseParseAdapter, PageResult, ParseResult, run_blocking
 
-from .base import BaseParseAdapter, PageResult, ParseResult
+if TYPE_CHECKING:
+    from reducto import Reducto
+
+# Markdown prefix per Reducto block type (types not listed are kept as-is)
+_BLOCK_PREFIXES = {"Section Header": "## "}
+
+# Block types left out of the page markdown
+_SKIPPED_BLOCK_TYPES = frozenset({"Footer"})
 
 
 class ReductoParser(BaseParseAdapter):
@@ -30,6 +38,41 @@ class ReductoParser(BaseParseAdapter):
             raise ValueError("Reducto API key is required")
         self.api_key = api_key
         self.summarize_figures = summarize_figures
+        self._client: Optional["Reducto"] = None  # Created on first parse, then reused
+
+        # Parse options (fixed per parser): optimal settings for structured content
+        self._parse_options: Dict[str, Any] = {
+            "enhance": {
+                "agentic": [],
+                "summarize_figures": summarize_figures,  # Configurable VLM enhancement
+            },
+            "retrieval": {
+                "chunking": {"chunk_mode": "variable"},  # Semantic chunking
+                "embedding_optimized": True,
+                "filter_blocks": [],
+            },
+            "formatting": {
+                "add_page_markers": True,  # Important for page mapping
+                "table_output_format": "dynamic",  # Best table format
+                "merge_tables": False,  # Keep tables separate
+            },
+            "settings": {
+                "ocr_system": "standard",
+                "timeout": 900,
+            },
+        }
+
+    def _get_client(self) -> "Reducto":
+        """Return the Reducto client, creating it on first use."""
+        if self._client is None:
+            # Imported here so loading the parsers (e.g. at API startup) doesn't
+            # pull in the Reducto SDK until a Reducto parse actually runs
+            from reducto import Reducto
+
+            # Pass the key explicitly rather than via REDUCTO_API_KEY, so parsers
+            # with different keys never see each other's key
+            self._client = Reducto(api_key=self.api_key)
+        return self._client
 
     async def parse_pdf(self, pdf_path: Path) -> ParseResult:
         """
@@ -43,89 +86,48 @@ class ReductoParser(BaseParseAdapter):
         """
         start_time = time.time()
 
-        # Initialize Reducto client with API key
-        # Note: Reducto client may still read from environment variable
-        # Set it temporarily to avoid requiring global environment configuration
-        os.environ["REDUCTO_API_KEY"] = self.api_key
-        client = Reducto()
+        # Reuse the Reducto client (and its connection pool) across parses
+        client = self._get_client()
 
-        # Upload file
-        upload_response = client.upload(file=pdf_path)
+        # Upload file (the SDK calls block, so run them in a worker thread
+        # to keep the event loop free for other parses)
+        upload_response = await run_blocking("reducto", client.upload, file=pdf_path)
 
-        # Parse with optimal settings for structured content
-        result = client.parse.run(
+        # Parse with the options built in __init__
+        result = await run_blocking(
+            "reducto",
+            client.parse.run,
             input=upload_response,
-            enhance={
-                "agentic": [],
-                "summarize_figures": self.summarize_figures,  # Configurable VLM enhancement
-            },
-            retrieval={
-                "chunking": {"chunk_mode": "variable"},  # Semantic chunking
-                "embedding_optimized": True,
-                "filter_blocks": [],
-            },
-            formatting={
-                "add_page_markers": True,  # Important for page mapping
-                "table_output_format": "dynamic",  # Best table format
-                "merge_tables": False,  # Keep tables separate
-            },
-            settings={
-                "ocr_system": "standard",
-                "timeout": 900,
-            },
+            **self._parse_options,
         )
 
-        # Debug: Save raw result structure (optional, only if temp dir exists)
-        import json
-        try:
-            temp_dir = Path("data/temp")
-            if temp_dir.exists():
-                debug_file_raw = temp_dir / "reducto_raw_result.json"
-                with open(debug_file_raw, 'w') as f:
-                    result_info = {
-                        "result_type": str(type(result)),
-                        "has_result_attr": hasattr(result, 'result'),
-                    }
-                    if hasattr(result, '__dict__'):
-                        result_info["result_dict_keys"] = list(result.__dict__.keys())
-                    if isinstance(result, dict):
-                        result_info["dict_keys"] = list(result.keys())
-                        result_info["result_value"] = result[:500] if len(str(result)) > 500 else result
-                    else:
-                        result_info["result_str"] = str(result)[:500]
-
-                    json.dump(result_info, f, indent=2, default=str)
-        except Exception as e:
-            # Silently ignore debug file errors
-            pass
+        # Debug: Save raw result structure (opt-in, only if temp dir exists;
+        # written from a worker thread so the file I/O doesn't block the loop)
+        if PARSE_DEBUG:
+            await asyncio.to_thread(self._dump_debug_result, result)
 
-        # Extract chunks from result - handle Reducto ParseResponse object
-        if hasattr(result, 'result'):
-            # result is a ParseResponse object with a result attribute
-            result_data = result.result
-            if hasattr(result_data, 'chunks'):
-                # result_data is a ResultFullResult object with chunks attribute
-                chunks = result_data.chunks
-            elif isinstance(result_data, dict):
-                chunks = result_data.get("chunks", [])
-            else:
-                chunks = []
+        # Extract chunks from result - a Reducto ParseResponse keeps them under
+        # .result (a full result with .chunks), a plain dict at the top level
+        result_data = getattr(result, 'result', result)
+        if isinstance(result_data, dict):
+            chunks = result_data.get("chunks", [])
         else:
-            result_data = result
-            chunks = result_data.get("chunks", []) if isinstance(result_data, dict) else []
+            chunks = getattr(result_data, 'chunks', None) or []
 
         # Map chunks to pages using block metadata
         pages = self._map_chunks_to_pages(chunks)
 
         processing_time = time.time() - start_time
 
-        # Extract usage information if available
-        usage = {}
-        if hasattr(result, 'usage'):
-            usage = result.usage if isinstance(result.usage, dict) else result.usage.__dict__
-        elif hasattr(result, '__dict__') and 'usage' in result.__dict__:
-            usage_attr = result.__dict__['usage']
-            usage = usage_attr if isinstance(usage_attr, dict) else usage_attr.__dict__
+        # Extract usage information if available (copied, since it is
+        # extended below and must not alias the SDK model's attributes)
+        usage_data = getattr(result, 'usage', None)
+        if usage_data is None:
+            usage = {}
+        elif isinstance(usage_data, dict):
+            usage = dict(usage_data)
+        else:
+            usage = dict(vars(usage_data))
 
         # Add num_pages and config to usage for cost calculation
         usage['num_pages'] = len(pages)
@@ -143,6 +145,31 @@ class ReductoParser(BaseParseAdapter):
             usage=usage,
         )
 
+    @staticmethod
+    def _dump_debug_result(result: Any) -> None:
+        """Write a summary of the raw Reducto result to data/temp for inspection."""
+        try:
+            temp_dir = Path("data/temp")
+            if temp_dir.exists():
+                debug_file_raw = temp_dir / "reducto_raw_result.json"
+                with open(debug_file_raw, 'w') as f:
+                    result_info = {
+                        "result_type": str(type(result)),
+                        "has_result_attr": hasattr(result, 'result'),
+                    }
+                    if hasattr(result, '__dict__'):
+                        result_info["result_dict_keys"] = list(result.__dict__.keys())
+                    if isinstance(result, dict):
+                        result_info["dict_keys"] = list(result.keys())
+                        result_info["result_value"] = result[:500] if len(str(result)) > 500 else result
+                    else:
+                        result_info["result_str"] = str(result)[:500]
+
+                    json.dump(result_info, f, indent=2, default=str)
+        except Exception:
+            # Silently ignore debug file errors
+            pass
+
     def _map_chunks_to_pages(self, chunks: List[Dict[str, Any]]) -> List[PageResult]:
         """
         Map Reducto chunks to pages using block metadata and construct proper markdown.
@@ -155,7 +182,6 @@ class ReductoParser(BaseParseAdapter):
         """
         page_map: Dict[int, List[str]] = defaultdict(list)
         page_images: Dict[int, List[str]] = defaultdict(list)
-        max_page = 0
 
         for chunk in chunks:
             # Convert Pydantic object to dict if needed
@@ -181,8 +207,10 @@ class ReductoParser(BaseParseAdapter):
                 else:
                     continue
 
-                # Get block type and content
+                # Get block type and content (skipping footer blocks early)
                 block_type = block_dict.get("type", "Text")
+                if block_type in _SKIPPED_BLOCK_TYPES:
+                    continue
                 content = block_dict.get("content", "")
 
                 if not content or not content.strip():
@@ -194,28 +222,14 @@ class ReductoParser(BaseParseAdapter):
                     bbox = bbox.__dict__
                 page_num = bbox.get("page", 1) if isinstance(bbox, dict) else 1
 
-                # Skip footer blocks
-                if block_type == "Footer":
-                    continue
-
-                # Format content based on block type
-                if block_type == "Section Header":
-                    formatted = f"## {content}\n\n"
-                elif block_type == "Table":
-                    # Table content already in markdown format
-                    formatted = f"{content}\n\n"
-                elif block_type == "List Item":
-                    formatted = f"{content}\n\n"
-                elif block_type == "Text":
-                    formatted = f"{content}\n\n"
-                else:
-                    # Unknown type, treat as text
-                    formatted = f"{content}\n\n"
+                # Format content based on block type (tables are already
+                # markdown; unknown types are treated as text)
+                prefix = _BLOCK_PREFIXES.get(block_type)
+                formatted = prefix + content if prefix else content
 
                 # Add to page map
                 if page_num > 0:  # Ignore negative page numbers
                     page_map[page_num].append(formatted)
-                    max_page = max(max_page, page_num)
 
                 # Extract image URLs if available
                 if block_type == "Image":
@@ -226,24 +240,25 @@ class ReductoParser(BaseParseAdapter):
         # Ensure we have at least one page
         if not page_map:
             page_map[1] = ["*No content extracted from blocks*"]
-            max_page = 1
-        else:
-            max_page = max(max_page, 1)
 
-        # Convert to PageResult objects
+        # Highest page with content (keys are all >= 1), taken once over the
+        # pages rather than tracked per block
+        max_page = max(page_map)
+
+        # Convert to PageResult objects. Blocks are separated by a blank line
+        # (joined once per page rather than appending "\n\n" to every block)
         pages = []
         for page_num in range(1, max_page + 1):
-            page_blocks = page_map.get(page_num, [])
-            markdown = "".join(page_blocks) if page_blocks else "*No content on this page*"
-
+            page_blocks = page_map.get(page_num, ())
+            images = page_images.get(page_num, [])
             pages.append(
                 PageResult(
                     page_number=page_num,
-                    markdown=markdown.strip(),
-                    images=page_images.get(page_num, []),
+                    markdown="\n\n".join(page_blocks).strip() if page_blocks else "*No content on this page*",
+                    images=images,
                     metadata={
                         "block_count": len(page_blocks),
-                        "has_images": len(page_images.get(page_num, [])) > 0,
+                        "has_images": bool(images),
                     },
                 )
             )
@@ -9,6 +9,7 @@ Handles:
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
 from src.adapters.base import BaseAdapter
@@ -138,19 +139,29 @@ class AdapterFactory:
         """
         Create multiple adapters at once.
 
+        Adapters are initialized and health-checked concurrently (each does
+        its own network round-trips), so setup takes as long as the slowest
+        provider rather than the sum of all of them.
+
         Args:
             provider_names: List of provider names to create
             provider_configs: Dict mapping provider name → config
 
         Returns:
             Dict mapping provider name → initialized adapter
+
+        Raises:
+            ValueError, RuntimeError: From the first provider (in order) that fails
         """
-        adapters = {}
-        for name in provider_names:
-            config = provider_configs.get(name, {})
-            adapters[name] = cls.create_adapter(name, config)
+        if not provider_names:
+            return {}
 
-        return adapters
+        with ThreadPoolExecutor(max_workers=len(provider_names)) as executor:
+            created = executor.map(
+                lambda name: cls.create_adapter(name, provider_configs.get(name, {})),
+                provider_names,
+            )
+            return dict(zip(provider_names, created))
 
     @staticmethod
     def validate_adapter(adapter: BaseAdapter) -> bool:
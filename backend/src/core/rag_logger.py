@@ -10,12 +10,27 @@ Logs all RAG operations to file for debugging and analysis:
 """
 
 import logging
-import json
-import threading
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+import orjson
+
+# Section header rules (level 1 and level 2)
+_MAJOR_RULE = "=" * 80
+_MINOR_RULE = "-" * 80
+
+# log_json output: indented like json.dumps(indent=2), non-string keys
+# allowed, numpy scalars (e.g. Ragas scores) written as plain numbers
+_LOG_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _truncate(text: str, limit: int = 500) -> str:
+    """Cut text to limit characters, marking the cut with '...'."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
 
 class RAGLogger:
     """
@@ -25,7 +40,7 @@ class RAGLogger:
     - Human-readable format
     - Complete data (no truncation)
     - Structured sections for easy parsing
-    - Thread-safe logging (uses threading.Lock)
+    - Thread-safe logging (records go through a queue to a background writer)
     """
 
     def __init__(self, log_dir: str = "data/results", test_name: str = "DocAgent-Arena"):
@@ -43,9 +58,6 @@ class RAGLogger:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.log_file = self.log_dir / f"{test_name}_{timestamp}.log"
 
-        # Thread safety lock
-        self._lock = threading.Lock()
-
         # Set up file handler
         self.logger = logging.getLogger(f"RAGLogger_{timestamp}")
         self.logger.setLevel(logging.INFO)
@@ -61,7 +73,14 @@ class RAGLogger:
         formatter = logging.Formatter('%(message)s')
         file_handler.setFormatter(formatter)
 
-        self.logger.addHandler(file_handler)
+        # Log calls only enqueue the record; a background listener thread does
+        # the file writes, so concurrent evaluation threads never wait on I/O
+        self._queue = queue.Queue(-1)
+        self._listener = QueueListener(self._queue, file_handler)
+        self._listener.start()
+        self._file_handler = file_handler
+
+        self.logger.addHandler(QueueHandler(self._queue))
 
         # Write header
         self.log_section("DocAgent-Arena TEST LOG")
@@ -77,22 +96,17 @@ class RAGLogger:
             title: Section title
             level: Header level (1=major, 2=minor, 3=sub)
         """
-        with self._lock:
-            if level == 1:
-                self.logger.info("=" * 80)
-                self.logger.info(f" {title}")
-                self.logger.info("=" * 80)
-            elif level == 2:
-                self.logger.info("-" * 80)
-                self.logger.info(f" {title}")
-                self.logger.info("-" * 80)
-            else:
-                self.logger.info(f"\n### {title}")
+        # One record per header, so lines from other threads can't interleave
+        if level == 1:
+            self.logger.info(f"{_MAJOR_RULE}\n {title}\n{_MAJOR_RULE}")
+        elif level == 2:
+            self.logger.info(f"{_MINOR_RULE}\n {title}\n{_MINOR_RULE}")
+        else:
+            self.logger.info(f"\n### {title}")
 
     def log(self, message: str):
         """Log a message (thread-safe)."""
-        with self._lock:
-            self.logger.info(message)
+        self.logger.info(message)
 
     def log_document(self, doc_id: str, doc_title: str, pdf_path: str,
                      pdf_size: int, num_questions: int, metadata: Optional[Dict] = None):
@@ -108,17 +122,21 @@ class RAGLogger:
             metadata: Additional metadata
         """
         self.log_section(f"DOCUMENT: {doc_id}", level=2)
-        self.log(f"ID: {doc_id}")
-        self.log(f"Title: {doc_title}")
-        self.log(f"PDF Path: {pdf_path}")
-        self.log(f"PDF Size: {pdf_size:,} bytes ({pdf_size / 1024 / 1024:.2f} MB)")
-        self.log(f"Questions: {num_questions}")
+        lines = [
+            f"ID: {doc_id}",
+            f"Title: {doc_title}",
+            f"PDF Path: {pdf_path}",
+            f"PDF Size: {pdf_size:,} bytes ({pdf_size / 1024 / 1024:.2f} MB)",
+            f"Questions: {num_questions}",
+        ]
 
         if metadata:
-            self.log("\nMetadata:")
-            for key, value in metadata.items():
-                self.log(f"  {key}: {value}")
-        self.log("")
+            lines.append("\nMetadata:")
+            lines.extend(f"  {key}: {value}" for key, value in metadata.items())
+        lines.append("")
+
+        # Emit the whole block as one record
+        self.log("\n".join(lines))
 
     def log_question(self, question_num: int, question: str, ground_truth: str,
                       question_id: Optional[str] = None):
@@ -151,26 +169,31 @@ class RAGLogger:
             latency_ms: Query latency in milliseconds
             metadata: Additional metadata (scores, etc.)
         """
-        self.log(f">>> {provider_name} Response:")
-        self.log(f"Latency: {latency_ms:.0f}ms")
-        self.log(f"Chunks Retrieved: {len(context_chunks)}")
+        lines = [
+            f">>> {provider_name} Response:",
+            f"Latency: {latency_ms:.0f}ms",
+            f"Chunks Retrieved: {len(context_chunks)}",
+        ]
 
         if metadata:
             # Log similarity scores if available
             if 'similarity_scores' in metadata:
                 scores = metadata['similarity_scores']
-                self.log(f"Similarity Scores: {[f'{s:.4f}' for s in scores]}")
+                lines.append(f"Similarity Scores: {[f'{s:.4f}' for s in scores]}")
             if 'avg_similarity_score' in metadata:
-                self.log(f"Avg Similarity: {metadata['avg_similarity_score']:.4f}")
+                lines.append(f"Avg Similarity: {metadata['avg_similarity_score']:.4f}")
 
-        self.log(f"\nAnswer:\n{answer}")
+        lines.append(f"\nAnswer:\n{answer}")
 
-        self.log(f"\nRetrieved Chunks ({len(context_chunks)}):")
+        lines.append(f"\nRetrieved Chunks ({len(context_chunks)}):")
         for i, chunk in enumerate(context_chunks, 1):
-            self.log(f"\n[Chunk {i}]")
-            self.log(chunk[:500] + ("..." if len(chunk) > 500 else ""))
+            lines.append(f"\n[Chunk {i}]")
+            lines.append(_truncate(chunk))
 
-        self.log("")
+        lines.append("")
+
+        # Emit the whole response as one record (one queue put, one write)
+        self.log("\n".join(lines))
 
     def log_evaluation_result(self, provider_name: str, question_num: int,
                                metrics: Dict[str, float]):
@@ -231,7 +254,8 @@ class RAGLogger:
             title: Section title
         """
         self.log_section(title, level=3)
-        self.log(json.dumps(data, indent=2))
+        # orjson writes UTF-8 directly (non-ASCII is not \u-escaped)
+        self.log(orjson.dumps(data, option=_LOG_JSON_OPTIONS).decode())
         self.log("")
 
     def close(self):
@@ -239,8 +263,10 @@ class RAGLogger:
         self.log_section("END OF LOG", level=1)
         self.log(f"Log file saved to: {self.log_file}")
 
-        # Close handlers
+        # Drain queued records to the file, then close handlers
+        self._listener.stop()
         for handler in self.logger.handlers:
             handler.close()
+        self._file_handler.close()
 
         print(f"\n📝 Detailed log saved to: {self.log_file}")
@@ -0,0 +1,83 @@
+"""
+Persistent cache of Ragas metric scores.
+
+Scores are keyed by the metric, the evaluator model and the exact sample
+(question, reference, response, retrieved contexts), so re-evaluating an
+unchanged sample reads the stored score instead of calling the LLM again.
+"""
+
+import hashlib
+import json
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+
+class RagasScoreCache:
+    """SQLite-backed {key: score} store, safe to share between threads."""
+
+    def __init__(self, path: str):
+        """
+        Initialize the score cache.
+
+        Args:
+            path: SQLite database file (created if missing)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS scores (key TEXT PRIMARY KEY, score REAL NOT NULL)")
+
+    def _connect(self) -> sqlite3.Connection:
+        # One short-lived connection per call, so evaluator threads never share
+        # one. The connection's own context manager only commits or rolls back,
+        # so callers wrap it in closing() as well.
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def key(
+        metric: str,
+        model: str,
+        user_input: str,
+        reference: str,
+        response: str,
+        retrieved_contexts: List[str],
+    ) -> str:
+        """Build the cache key for one metric score of one sample."""
+        payload = json.dumps([metric, model, user_input, reference, response, retrieved_contexts])
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, float]:
+        """
+        Look up cached scores.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            {key: score} for the keys that are cached
+        """
+        keys = list(keys)
+        found = {}
+        with closing(self._connect()) as conn:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                found.update(conn.execute(
+                    f"SELECT key, score FROM scores WHERE key IN ({placeholders})", batch
+                ))
+        return found
+
+    def set_many(self, scores: Dict[str, float]) -> None:
+        """
+        Store scores.
+
+        Args:
+            scores: {key: score} to store (replacing existing entries)
+        """
+        if not scores:
+            return
+        with closing(self._connect()) as conn, conn:
+            conn.executemany("INSERT OR REPLACE INTO scores (key, score) VALUES (?, ?)", scores.items())
@@ -5,17 +5,36 @@ Provides a clean interface to Ragas metrics for evaluating RAG provider response
 Uses standard Ragas metrics: Faithfulness, FactualCorrectness, LLMContextRecall.
 """
 
+import asyncio
 import os
 import time
-from typing import List, Dict, Any
+from statistics import fmean
+from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 
-from ragas import evaluate, EvaluationDataset
+from ragas import RunConfig, SingleTurnSample
 from ragas.metrics import LLMContextRecall, Faithfulness, FactualCorrectness
 from ragas.llms import llm_factory
 
+from src.core.ragas_cache import RagasScoreCache
 
-@dataclass
+# Rate-limited metric calls are retried with exponential backoff
+_RATE_LIMIT_MAX_RETRIES = 5
+_RATE_LIMIT_BASE_DELAY = 2.0
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    """Check if an error is an LLM rate limit (HTTP 429)."""
+    error_msg = str(error)
+    return "rate_limit" in error_msg.lower() or "429" in error_msg
+
+
+def _rate_limit_delay(attempt: int) -> float:
+    """Backoff before retry number attempt + 1: exponential, with jitter."""
+    return _RATE_LIMIT_BASE_DELAY * (2 ** attempt) + (time.time() % 1)
+
+
+@dataclass(slots=True)
 class RAGEvaluationSample:
     """
     Sample for RAG evaluation.
@@ -33,11 +52,11 @@ class RAGEvaluationSample:
     metadata: Dict[str, Any] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationResult:
     """Results from Ragas evaluation."""
     scores: Dict[str, float]  # Metric name -> score
-    raw_results: Any  # Raw Ragas result object
+    raw_results: Any  # Per-sample metric scores
     sample_count: int
 
 
@@ -60,6 +79,9 @@ class RagasEvaluator:
                 - model: LLM model name (default: gpt-4o-mini)
                 - api_key_env: Environment variable for API key (default: OPENAI_API_KEY)
                 - metrics: List of metric names to use (default: all)
+                - max_concurrency: Max metric LLM calls in flight per evaluation (default: 20)
+                - score_cache: SQLite file caching scores of unchanged samples
+                  across runs (default: None, no caching)
         """
         config = config or {}
 
@@ -72,12 +94,24 @@ class RagasEvaluator:
             raise ValueError(f"API key not found in environment variable: {api_key_env}")
 
         # Initialize LLM for Ragas using modern factory
+        self.model = model
         self.evaluator_llm = llm_factory(model)
 
         # Initialize metrics
         metric_names = config.get('metrics', ['faithfulness', 'factual_correctness', 'context_recall'])
         self.metrics = self._init_metrics(metric_names, self.evaluator_llm)
 
+        # Metrics are scored directly (not via ragas.evaluate), so apply the
+        # run config (timeouts, retries) that evaluate() would have set
+        self.run_config = RunConfig()
+        for metric in self.metrics:
+            metric.init(self.run_config)
+
+        self.max_concurrency = config.get('max_concurrency', 20)
+
+        score_cache = config.get('score_cache')
+        self.score_cache = RagasScoreCache(score_cache) if score_cache else None
+
     def _init_metrics(self, metric_names: List[str], llm: Any) -> List[Any]:
         """Initialize Ragas metrics from names with LLM set."""
         metric_map = {
@@ -113,76 +147,118 @@ class RagasEvaluator:
         if not samples:
             raise ValueError("No samples provided for evaluation")
 
-        # Convert to Ragas format
-        dataset_list = [
-            {
-                "user_input": sample.user_input,
-                "reference": sample.reference,
-                "retrieved_contexts": sample.retrieved_contexts,
-                "response": sample.response,
-            }
-            for sample in samples
-        ]
-
-        # Create Ragas EvaluationDataset
-        evaluation_dataset = EvaluationDataset.from_list(dataset_list)
-
-        # Run evaluation with retry logic for rate limits
-        max_retries = 5
-        base_delay = 2.0
-        result = None
-
-        for attempt in range(max_retries):
-            try:
-                # Run evaluation (disable progress bar to avoid clutter in parallel execution)
-                result = evaluate(
-                    dataset=evaluation_dataset,
-                    metrics=self.metrics,
-                    llm=self.evaluator_llm,
-                    show_progress=False
-                )
-                break  # Success - exit retry loop
-
-            except Exception as e:
-                error_msg = str(e)
-                is_rate_limit = "rate_limit" in error_msg.lower() or "429" in error_msg
-
-                if is_rate_limit and attempt < max_retries - 1:
-                    # Exponential backoff with jitter
-                    delay = base_delay * (2 ** attempt) + (time.time() % 1)
-                    print(f"      ⚠️  Rate limit hit (attempt {attempt + 1}/{max_retries}), retrying in {delay:.1f}s...")
-                    time.sleep(delay)
-                else:
-                    # Non-rate-limit error or final attempt - re-raise
-                    if attempt == max_retries - 1:
-                        print(f"      ❌ Failed after {max_retries} attempts: {error_msg}")
-                    raise
-
-        if result is None:
-            raise RuntimeError("Evaluation failed - no result returned")
-
-        # Extract scores from Ragas EvaluationResult
-        # The Ragas evaluate() function returns an EvaluationResult with .scores dict
-        # Convert to pandas and get mean scores
-        result_df = result.to_pandas()
-
-        # Get mean scores for each metric (excluding non-metric columns)
-        metric_columns = [col for col in result_df.columns
-                          if col not in ['user_input', 'reference', 'response', 'retrieved_contexts']]
+        # Rate limits are retried per metric call inside _aevaluate
+        sample_scores = asyncio.run(self._aevaluate(samples))
 
+        # Mean score per metric across samples (failed scores are NaN and
+        # skipped; a metric that failed on every sample stays NaN)
         scores = {}
-        for metric in metric_columns:
-            if metric in result_df.columns:
-                # Calculate mean score across all samples
-                mean_score = result_df[metric].mean()
-                scores[metric] = float(mean_score)
+        for metric_name in sample_scores[0]:
+            valid = [
+                row[metric_name] for row in sample_scores
+                if row[metric_name] == row[metric_name]  # NaN != NaN
+            ]
+            scores[metric_name] = fmean(valid) if valid else float("nan")
 
         return EvaluationResult(
             scores=scores,
-            raw_results=result,
+            raw_results=sample_scores,
             sample_count=len(samples)
         )
 
+    async def _aevaluate(self, samples: List[RAGEvaluationSample]) -> List[Dict[str, float]]:
+        """
+        Score every (sample, metric) pair concurrently.
+
+        Each pair is one independent LLM-backed scoring call, so they all run
+        at once (bounded by max_concurrency) instead of one after another.
+        With a score cache, only pairs not scored before are sent to the LLM.
+
+        Args:
+            samples: Evaluation samples
+
+        Returns:
+            One {metric key: score} dict per sample, in sample order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def score(metric: Any, sample: SingleTurnSample) -> float:
+            for attempt in range(_RATE_LIMIT_MAX_RETRIES):
+                async with semaphore:
+                    try:
+                        return await metric.single_turn_ascore(sample, timeout=self.run_config.timeout)
+                    except Exception as e:
+                        if not _is_rate_limit_error(e) or attempt == _RATE_LIMIT_MAX_RETRIES - 1:
+                            # Same as ragas.evaluate: a failed score is NaN, not a failed run
+                            print(f"      ⚠️  {metric.name} scoring failed: {e}")
+                            return float("nan")
+
+                # Back off outside the semaphore so other calls keep running
+                delay = _rate_limit_delay(attempt)
+                print(f"      ⚠️  Rate limit hit (attempt {attempt + 1}/{_RATE_LIMIT_MAX_RETRIES}), retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+
+        ragas_samples = [
+            SingleTurnSample(
+                user_input=sample.user_input,
+                reference=sample.reference,
+                retrieved_contexts=sample.retrieved_contexts,
+                response=sample.response,
+            )
+            for sample in samples
+        ]
+
+        # Score keys like ragas.evaluate (mode metrics such as
+        # FactualCorrectness are keyed "name(mode=...)")
+        metric_keys = [
+            f"{metric.name}(mode={metric.mode})" if getattr(metric, 'mode', None) else metric.name
+            for metric in self.metrics
+        ]
+
+        # One (sample, metric) pair per score, sample-major
+        pairs = [
+            (sample, metric, metric_key)
+            for sample in samples
+            for metric, metric_key in zip(self.metrics, metric_keys)
+        ]
+
+        # Previously cached scores of unchanged samples skip the LLM
+        results: List[Optional[float]] = [None] * len(pairs)
+        cache_keys: List[str] = []
+        if self.score_cache:
+            cache_keys = [
+                RagasScoreCache.key(
+                    metric_key, self.model, sample.user_input, sample.reference,
+                    sample.response, sample.retrieved_contexts,
+                )
+                for sample, _, metric_key in pairs
+            ]
+            cached = self.score_cache.get_many(cache_keys)
+            results = [cached.get(cache_key) for cache_key in cache_keys]
+
+        num_metrics = len(self.metrics)
+        miss_indices = [i for i, value in enumerate(results) if value is None]
+        miss_scores = await asyncio.gather(*(
+            score(pairs[i][1], ragas_samples[i // num_metrics])
+            for i in miss_indices
+        ))
+        for i, value in zip(miss_indices, miss_scores):
+            results[i] = value
+
+        if self.score_cache:
+            # Failed (NaN) scores are left out so they are retried next time
+            self.score_cache.set_many({
+                cache_keys[i]: value
+                for i, value in zip(miss_indices, miss_scores)
+                if value == value  # NaN != NaN
+            })
+
+        # Reshape the flat results into per-sample rows
+        return [
+            dict(zip(metric_keys, results[i:i + num_metrics]))
+            for i in range(0, len(results), num_metrics)
+        ]
+
     def evaluate_single_provider(
         self,
         questions: List[str],
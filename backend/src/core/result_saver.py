@@ -73,8 +73,7 @@ class ResultSaver:
             doc_dir.mkdir(exist_ok=True)
 
             result_path = doc_dir / f"{result.provider}.json"
-            with open(result_path, 'w') as f:
-                json.dump(result.to_dict(), f, indent=2)
+            result_path.write_bytes(result.to_json_bytes())
 
             print(f"   💾 Saved: {result_path.relative_to(self.output_dir)}")
 
@@ -89,8 +88,7 @@ class ResultSaver:
             doc_dir.mkdir(exist_ok=True)
 
             result_path = doc_dir / "aggregated.json"
-            with open(result_path, 'w') as f:
-                json.dump(doc_result.to_dict(), f, indent=2)
+            result_path.write_bytes(doc_result.to_json_bytes())
 
             print(f"   💾 Saved: {result_path.relative_to(self.output_dir)}")
 
@@ -118,8 +116,7 @@ class ResultSaver:
         """
         with self._write_lock:
             summary_path = self.run_dir / "summary.json"
-            with open(summary_path, 'w') as f:
-                json.dump(summary.to_dict(), f, indent=2)
+            summary_path.write_bytes(summary.to_json_bytes())
 
             print(f"\n📊 Run summary saved: {summary_path}")
 
@@ -135,7 +132,7 @@ class ResultSaver:
         if not aggregated_path.exists():
             raise FileNotFoundError(f"No saved result for document: {doc_id}")
 
-        with open(aggregated_path) as f:
+        with open(aggregated_path, encoding='utf-8') as f:
             data = json.load(f)
 
         return data
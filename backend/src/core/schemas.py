@@ -3,16 +3,22 @@ Data schemas for DocAgent-Arena benchmark.
 
 All data structures are dataclasses for:
 - Type safety
-- Easy serialization (dataclasses.asdict)
+- Easy serialization (to_dict)
 - Clear API contracts
 """
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+import orjson
 
-@dataclass
+# Result files keep json.dump(indent=2)'s layout; numpy scalars (e.g. from
+# Ragas scores) are written as plain numbers
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+@dataclass(slots=True)
 class DocumentData:
     """
     Represents a single document in the dataset.
@@ -29,12 +35,16 @@ class DocumentData:
 
     def to_dict(self) -> Dict:
         """Convert to dict for JSON serialization."""
-        d = asdict(self)
-        d['pdf_path'] = str(self.pdf_path) if self.pdf_path else None  # Path → str for JSON
-        return d
+        return {
+            'doc_id': self.doc_id,
+            'doc_title': self.doc_title,
+            'pdf_path': str(self.pdf_path) if self.pdf_path else None,  # Path → str for JSON
+            'pdf_size_bytes': self.pdf_size_bytes,
+            'metadata': dict(self.metadata)
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class QuestionData:
     """Represents a single question."""
     question_id: str
@@ -44,10 +54,15 @@ class QuestionData:
 
     def to_dict(self) -> Dict:
         """Convert to dict for JSON serialization."""
-        return asdict(self)
+        return {
+            'question_id': self.question_id,
+            'question': self.question,
+            'ground_truth': self.ground_truth,
+            'metadata': dict(self.metadata)
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class QuestionResult:
     """Result for a single question from a provider."""
     question_id: str
@@ -61,10 +76,19 @@ class QuestionResult:
 
     def to_dict(self) -> Dict:
         """Convert to dict for JSON serialization."""
-        return asdict(self)
+        return {
+            'question_id': self.question_id,
+            'question': self.question,
+            'ground_truth': self.ground_truth,
+            'response_answer': self.response_answer,
+            'response_context': list(self.response_context),
+            'response_latency_ms': self.response_latency_ms,
+            'response_metadata': dict(self.response_metadata),
+            'evaluation_scores': dict(self.evaluation_scores)
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderResult:
     """Complete result for one provider on one document."""
     provider: str
@@ -93,8 +117,12 @@ class ProviderResult:
             'timestamp_end': self.timestamp_end
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize to (indented) JSON bytes."""
+        return orjson.dumps(self.to_dict(), option=_JSON_OPTIONS)
 
-@dataclass
+
+@dataclass(slots=True)
 class DocumentResult:
     """Aggregated results for all providers on one document."""
     doc_id: str
@@ -115,8 +143,12 @@ class DocumentResult:
             'timestamp': self.timestamp
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize to (indented) JSON bytes."""
+        return orjson.dumps(self.to_dict(), option=_JSON_OPTIONS)
+
 
-@dataclass
+@dataclass(slots=True)
 class RunSummary:
     """Overall benchmark run summary."""
     run_id: str
@@ -144,3 +176,7 @@ class RunSummary:
             'timestamp_start': self.timestamp_start,
             'timestamp_end': self.timestamp_end
         }
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to (indented) JSON bytes."""
+        return orjson.dumps(self.to_dict(), option=_JSON_OPTIONS)
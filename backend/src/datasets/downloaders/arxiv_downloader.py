@@ -4,8 +4,10 @@ Arxiv PDF downloader with caching and rate limiting.
 Downloads research documents from arxiv.org for RAG evaluation datasets.
 """
 
+import threading
 import time
 import arxiv
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 import logging
@@ -39,13 +41,15 @@ class ArxivDownloader:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.rate_limit_delay = rate_limit_delay
         self.last_download_time = 0
+        self._rate_limit_lock = threading.Lock()  # Shared by download_batch workers
 
     def _rate_limit(self):
-        """Apply rate limiting between downloads."""
-        elapsed = time.time() - self.last_download_time
-        if elapsed < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - elapsed)
-        self.last_download_time = time.time()
+        """Apply rate limiting between downloads (across all threads)."""
+        with self._rate_limit_lock:
+            elapsed = time.time() - self.last_download_time
+            if elapsed < self.rate_limit_delay:
+                time.sleep(self.rate_limit_delay - elapsed)
+            self.last_download_time = time.time()
 
     def download(self, arxiv_id: str) -> Optional[Path]:
         """
@@ -85,17 +89,23 @@ class ArxivDownloader:
             logger.warning(f"Failed to download {arxiv_id}: {e}")
             return None
 
-    def download_batch(self, arxiv_ids: list[str]) -> dict[str, Optional[Path]]:
+    def download_batch(self, arxiv_ids: list[str], max_workers: int = 8) -> dict[str, Optional[Path]]:
         """
-        Download multiple PDFs.
+        Download multiple PDFs concurrently.
+
+        Requests still start at most one per rate_limit_delay, but transfers
+        overlap and cached PDFs return without waiting for a slot.
 
         Args:
             arxiv_ids: List of arxiv document IDs
+            max_workers: Maximum concurrent downloads
 
         Returns:
             Dict mapping arxiv_id -> pdf_path (or None if failed)
         """
-        results = {}
-        for arxiv_id in arxiv_ids:
-            results[arxiv_id] = self.download(arxiv_id)
-        return results
+        unique_ids = list(dict.fromkeys(arxiv_ids))  # Never fetch the same PDF twice at once
+        if not unique_ids:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_ids))) as executor:
+            return dict(zip(unique_ids, executor.map(self.download, unique_ids)))
@@ -5,6 +5,7 @@ Downloads PolicyQA JSON files from GitHub repository.
 """
 
 import requests
+import shutil
 from pathlib import Path
 from typing import Optional
 import logging
@@ -35,6 +36,7 @@ class PolicyQADownloader:
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._session = requests.Session()  # Keep-alive across splits (one TLS handshake)
 
     def download(self, split: str = "train") -> Optional[Path]:
         """
@@ -65,13 +67,14 @@ class PolicyQADownloader:
         logger.info(f"Downloading PolicyQA {split} split from {url}")
 
         try:
-            response = requests.get(url, stream=True, timeout=30)
+            response = self._session.get(url, stream=True, timeout=30)
             response.raise_for_status()
 
-            # Write to cache
+            # Write to cache (copied in 1 MB blocks by shutil rather than
+            # a Python loop over small chunks; decode_content undoes any gzip)
+            response.raw.decode_content = True
             with open(json_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                shutil.copyfileobj(response.raw, f, length=1024 * 1024)
 
             file_size_mb = json_path.stat().st_size / (1024 * 1024)
             logger.info(f"Successfully downloaded: {split}.json ({file_size_mb:.2f} MB)")
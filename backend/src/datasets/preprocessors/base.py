@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class DatasetSample:
     """
     Standardized dataset sample format.
@@ -27,7 +27,7 @@ class DatasetSample:
     metadata: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedDataset:
     """Container for processed dataset samples."""
     samples: List[DatasetSample]
@@ -5,24 +5,33 @@ Loads Qasper dataset from HuggingFace, downloads PDFs from arxiv,
 and extracts raw text for realistic RAG evaluation.
 """
 
+import hashlib
 import logging
+import multiprocessing
+import os
 import requests
+import shutil
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Optional
 from pathlib import Path
-from datasets import load_dataset
+import pyarrow.parquet as pq
 
 from .base import BasePreprocessor, DatasetSample, ProcessedDataset
 from ..downloaders.arxiv_downloader import ArxivDownloader
 
 logger = logging.getLogger(__name__)
 
+# Runs with at least this many PDFs extract their text across processes
+_PARALLEL_EXTRACT_MIN_DOCS = 4
+
 
 class QasperPreprocessor(BasePreprocessor):
     """
     Preprocessor for Qasper dataset (Question Answering on Scholarly Publications).
 
     Approach:
-    1. Load metadata from HuggingFace datasets (document IDs, questions, answers)
+    1. Load metadata from HuggingFace's Qasper parquet (document IDs, questions, answers)
     2. Download original PDFs from arxiv (realistic RAG test with formatting artifacts)
     3. Extract raw text from PDFs (no cleaning - RAG should handle messy text)
     4. Create samples: question + raw_pdf_text + ground_truth_answer
@@ -41,6 +50,10 @@ class QasperPreprocessor(BasePreprocessor):
             use_storage: If True, check Supabase Storage for PDFs first
         """
         self.downloader = ArxivDownloader(cache_dir=cache_dir)
+
+        # Extracted PDF text, keyed by PDF content hash (reruns skip pypdf)
+        self.text_cache_dir = Path(cache_dir).parent / "text"
+        self.text_cache_dir.mkdir(parents=True, exist_ok=True)
         self.use_storage = use_storage
         self.storage = None
 
@@ -52,17 +65,27 @@ class QasperPreprocessor(BasePreprocessor):
                 logger.warning(f"Failed to initialize storage service: {e}, using local only")
                 self.use_storage = False
 
-    def _extract_pdf_text(self, pdf_path: Path) -> Optional[str]:
+    @staticmethod
+    def _extract_pdf_text(pdf_path: Path, text_cache_dir: Path) -> Optional[str]:
         """
         Extract raw text from PDF using pypdf.
 
+        Text is cached on disk by PDF content hash, so the same PDF (from the
+        local cache or a fresh storage download) is only parsed once.
+
         Args:
             pdf_path: Path to PDF file
+            text_cache_dir: Directory of cached extracted text
 
         Returns:
             Raw text from PDF, or None if extraction failed
         """
         try:
+            text_cache = text_cache_dir / f"{hashlib.sha256(Path(pdf_path).read_bytes()).hexdigest()}.txt"
+            if text_cache.exists():
+                logger.debug(f"Using cached text for {pdf_path}")
+                return text_cache.read_text(encoding="utf-8")
+
             from pypdf import PdfReader
             reader = PdfReader(str(pdf_path))
             text_parts = []
@@ -73,12 +96,46 @@ class QasperPreprocessor(BasePreprocessor):
                     text_parts.append(text)
 
             full_text = "\n\n".join(text_parts)
-            return full_text if full_text.strip() else None
+            if not full_text.strip():
+                return None
+
+            # Write atomically so an interrupted run never leaves partial text
+            # (the cache is best-effort: a failed write just means re-extracting)
+            tmp_file = text_cache.with_suffix(".tmp")
+            try:
+                tmp_file.write_text(full_text, encoding="utf-8")
+                tmp_file.replace(text_cache)
+            except OSError as e:
+                logger.debug(f"Failed to cache text for {pdf_path}: {e}")
+            return full_text
 
         except Exception as e:
             logger.warning(f"Failed to extract text from {pdf_path}: {e}")
             return None
 
+    @staticmethod
+    def _extraction_pool(num_docs: int) -> Executor:
+        """
+        Executor for PDF text extraction, run alongside the PDF downloads.
+
+        Larger runs extract across processes (pypdf is CPU-bound pure Python);
+        smaller ones use a single background thread. Worker processes are
+        spawned rather than forked: forking a multithreaded process (the
+        orchestrator or API server) can deadlock the child.
+
+        Args:
+            num_docs: Number of documents to process
+
+        Returns:
+            Executor to submit _extract_pdf_text calls to
+        """
+        if num_docs < _PARALLEL_EXTRACT_MIN_DOCS:
+            return ThreadPoolExecutor(max_workers=1)
+        return ProcessPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, num_docs),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
     def _extract_answer(self, answer_dict: dict) -> str:
         """
         Extract answer text from Qasper answer structure.
@@ -175,9 +232,10 @@ class QasperPreprocessor(BasePreprocessor):
                 response = requests.get(api_url, stream=True)
                 response.raise_for_status()
 
+                # Copy in 1 MB blocks (decode_content undoes any gzip encoding)
+                response.raw.decode_content = True
                 with open(parquet_cache, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+                    shutil.copyfileobj(response.raw, f, length=1024 * 1024)
                 logger.info(f"Downloaded and cached to {parquet_cache}")
             else:
                 logger.info(f"Using cached parquet file: {parquet_cache}")
@@ -185,8 +243,13 @@ class QasperPreprocessor(BasePreprocessor):
             parquet_path = parquet_cache
 
         try:
-            # Load dataset from parquet file
-            dataset = load_dataset("parquet", data_files=str(parquet_path), split="train")
+            # Load only the columns used below (skipping e.g. the large full_text)
+            # and only the rows to process
+            table = pq.read_table(str(parquet_path), columns=['id', 'title', 'qas'])
+            total_docs = table.num_rows
+            if max_docs:
+                table = table.slice(0, max_docs)
+            dataset = table.to_pylist()
 
             samples = []
             stats = {
@@ -199,43 +262,60 @@ class QasperPreprocessor(BasePreprocessor):
             }
 
             # Process documents
-            docs_to_process = min(len(dataset), max_docs) if max_docs else len(dataset)
-            logger.info(f"Processing {docs_to_process} documents from {len(dataset)} total")
+            docs_to_process = len(dataset)
+            logger.info(f"Processing {docs_to_process} documents from {total_docs} total")
+
+            # Text is extracted in the background as each PDF arrives, so
+            # extraction overlaps with the remaining downloads
+            fetched_docs = []
+            with self._extraction_pool(docs_to_process) as pool:
+                for i, doc_data in enumerate(dataset):
+                    stats['total_docs'] += 1
+                    arxiv_id = doc_data['id']
+
+                    logger.info(f"[{i+1}/{docs_to_process}] Processing document: {arxiv_id}")
+
+                    # Try to get PDF: 1) Cloud storage, 2) Local cache, 3) Download from arxiv
+                    pdf_path = None
+
+                    # 1. Check Supabase Storage first
+                    if self.use_storage and self.storage:
+                        storage_path = f"qasper/pdfs/{arxiv_id}.pdf"
+                        if self.storage.check_exists(storage_path):
+                            logger.info(f"Found PDF in cloud storage: {storage_path}")
+                            try:
+                                pdf_path = self.storage.download_to_temp(storage_path)
+                            except Exception as e:
+                                logger.warning(f"Failed to download from storage: {e}, trying local/arxiv")
+
+                    # 2. Fall back to local cache or download from arxiv
+                    if pdf_path is None:
+                        pdf_path = self.downloader.download(arxiv_id)
+
+                    if pdf_path is None:
+                        logger.warning(f"Failed to get document {arxiv_id}, skipping")
+                        stats['failed_downloads'] += 1
+                        continue
 
-            for i, doc_data in enumerate(dataset):
-                if max_docs and i >= max_docs:
-                    break
+                    # Extract raw text from the PDF while the next ones download
+                    try:
+                        text_future = pool.submit(self._extract_pdf_text, pdf_path, self.text_cache_dir)
+                    except BrokenProcessPool as e:
+                        logger.warning(f"Failed to extract text from {arxiv_id} ({e}), skipping")
+                        stats['failed_downloads'] += 1
+                        continue
+                    fetched_docs.append((doc_data, pdf_path, text_future))
 
-                stats['total_docs'] += 1
+            for doc_data, pdf_path, text_future in fetched_docs:
                 arxiv_id = doc_data['id']
                 title = doc_data['title']
+                try:
+                    pdf_text = text_future.result()
+                except BrokenProcessPool as e:
+                    # A worker died (e.g. killed for memory); same as a failed extraction
+                    logger.warning(f"Text extraction worker for {arxiv_id} failed: {e}")
+                    pdf_text = None
 
-                logger.info(f"[{i+1}/{docs_to_process}] Processing document: {arxiv_id}")
-
-                # Try to get PDF: 1) Cloud storage, 2) Local cache, 3) Download from arxiv
-                pdf_path = None
-
-                # 1. Check Supabase Storage first
-                if self.use_storage and self.storage:
-                    storage_path = f"qasper/pdfs/{arxiv_id}.pdf"
-                    if self.storage.check_exists(storage_path):
-                        logger.info(f"Found PDF in cloud storage: {storage_path}")
-                        try:
-                            pdf_path = self.storage.download_to_temp(storage_path)
-                        except Exception as e:
-                            logger.warning(f"Failed to download from storage: {e}, trying local/arxiv")
-
-                # 2. Fall back to local cache or download from arxiv
-                if pdf_path is None:
-                    pdf_path = self.downloader.download(arxiv_id)
-
-                if pdf_path is None:
-                    logger.warning(f"Failed to get document {arxiv_id}, skipping")
-                    stats['failed_downloads'] += 1
-                    continue
-
-                # Extract raw text from PDF
-                pdf_text = self._extract_pdf_text(pdf_path)
                 if pdf_text is None:
                     logger.warning(f"Failed to extract text from {arxiv_id}, skipping")
                     stats['failed_downloads'] += 1
@@ -0,0 +1,76 @@
+"""
+Tests for LandingAI markdown normalization.
+
+The precompiled implementation must produce exactly what the original
+sequence of re.sub() calls produced, reproduced here as a reference.
+"""
+
+import re
+
+import pytest
+
+from src.adapters.parsing.landingai_parser import LandingAIParser
+
+
+def _reference_normalize(markdown: str) -> str:
+    """Original LandingAIParser._normalize_markdown, one re.sub() per step."""
+    if not markdown:
+        return markdown
+
+    markdown = re.sub(r'<a id=["\'][\w\-]+["\']></a>\s*', '', markdown)
+
+    def enhance_table(match):
+        table_content = match.group(0)
+        table_id_match = re.search(r'<table[^>]*id=["\']([^"\']+)["\'][^>]*>', table_content)
+        table_id = f' id="{table_id_match.group(1)}"' if table_id_match else ''
+        rows = re.findall(r'<tr[^>]*>.*?</tr>', table_content, re.DOTALL)
+        if not rows:
+            return table_content
+        header_row = re.sub(r'<td([^>]*)>(.*?)</td>', r'<th\1>\2</th>', rows[0])
+        enhanced = f'<table{table_id}>\n<thead>\n{header_row}\n</thead>\n<tbody>\n'
+        enhanced += '\n'.join(rows[1:])
+        enhanced += '\n</tbody>\n</table>'
+        return enhanced
+
+    markdown = re.sub(r'<table[^>]*>.*?</table>', enhance_table, markdown, flags=re.DOTALL)
+    markdown = re.sub(r'Page \| \d+\s*', '', markdown)
+    markdown = re.sub(r'Copyright ©\d{4}[^\n]*\n*', '', markdown)
+    markdown = re.sub(r'\n\n\n+', '\n\n', markdown)
+    return markdown.strip()
+
+
+TABLES_WITH_ANCHORS = [
+    "<table><tr><td><a id='q'></a>\nX</td></tr></table>",
+    "<table id=\"t1\"><tr><td><a id='h-1'></a>\nName</td><td>Value</td></tr>"
+    "<tr><td><a id=\"c-2\"></a>\nfoo</td><td>1</td></tr></table>",
+    "<a id='intro'></a>\n\nIntro text\n\n\n\n<table class=\"x\" id='tbl'>\n"
+    "<tr><td colspan=\"2\">A</td></tr>\n<tr><td>B</td><td>C</td></tr>\n</table>\n<a id='end'></a>",
+    "<table><tr><td>one</td></tr></table>\n\n<a id='x'></a>\n<table><tr><td><a id='y'></a>\ntwo</td></tr></table>",
+    "<table><caption><a id='cap'></a>\nno rows</caption></table>",
+]
+
+
+@pytest.mark.parametrize("markdown", TABLES_WITH_ANCHORS)
+def test_normalize_tables_with_anchors_matches_reference(markdown):
+    assert LandingAIParser._normalize_markdown(markdown) == _reference_normalize(markdown)
+
+
+def test_normalize_anchor_in_header_cell():
+    normalized = LandingAIParser._normalize_markdown("<table><tr><td><a id='q'></a>\nX</td></tr></table>")
+    assert "<th>X</th>" in normalized
+    assert "<td>" not in normalized
+
+
+PAGE_MARKERS_AND_COPYRIGHT = [
+    "Intro\n\nPage | 3\n\n\n\nBody\nCopyright ©2024 ACME Corp. All rights reserved.\n\n\nEnd",
+    "<table><tr><td>Page | 3\nTotal</td></tr><tr><td>1</td></tr></table>",
+    "<table><tr><td>Copyright ©2023 x</td></tr>\n<tr><td>y</td></tr></table>\n\n\nafter",
+    "Copyright ©Page | 1 2020 notice\nkept?",
+    "Copyright ©2021 Page | 4 footer\n\n\n\nPage | 5",
+    "   \n\n\n\nPage | 12   \n\n\n",
+]
+
+
+@pytest.mark.parametrize("markdown", PAGE_MARKERS_AND_COPYRIGHT)
+def test_normalize_cleanup_matches_sequential_substitutions(markdown):
+    assert LandingAIParser._normalize_markdown(markdown) == _reference_normalize(markdown)
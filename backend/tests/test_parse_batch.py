@@ -0,0 +1,50 @@
+"""
+Tests for BaseParseAdapter.parse_batch.
+
+Uses a stub parser, so no provider API calls are made.
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from src.adapters.parsing import BaseParseAdapter, PageResult, ParseResult
+
+
+class StubParser(BaseParseAdapter):
+    """Parser that fails for PDFs named bad*.pdf and is cancelled for cancel*.pdf."""
+
+    async def parse_pdf(self, pdf_path: Path) -> ParseResult:
+        await asyncio.sleep(0)
+        if pdf_path.name.startswith("bad"):
+            raise ValueError(f"cannot parse {pdf_path.name}")
+        if pdf_path.name.startswith("cancel"):
+            raise asyncio.CancelledError()
+        return ParseResult(
+            provider="stub",
+            total_pages=1,
+            pages=[PageResult(page_number=1, markdown=pdf_path.stem)],
+            raw_response={},
+            processing_time=0.0,
+        )
+
+
+def test_parse_batch_keeps_other_results_when_one_fails():
+    pdf_paths = [Path("a.pdf"), Path("bad.pdf"), Path("c.pdf")]
+
+    batch = asyncio.run(StubParser().parse_batch(pdf_paths, concurrency=2))
+
+    assert [path for path, _ in batch.successful] == [Path("a.pdf"), Path("c.pdf")]
+    assert [result.pages[0].markdown for _, result in batch.successful] == ["a", "c"]
+    assert len(batch.failed) == 1
+    failed_path, error = batch.failed[0]
+    assert failed_path == Path("bad.pdf")
+    assert isinstance(error, ValueError)
+
+
+def test_parse_batch_propagates_cancellation():
+    pdf_paths = [Path("a.pdf"), Path("cancel.pdf")]
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(StubParser().parse_batch(pdf_paths))
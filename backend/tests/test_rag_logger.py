@@ -0,0 +1,18 @@
+"""
+Tests for RAGLogger file output.
+"""
+
+import numpy as np
+
+from src.core.rag_logger import RAGLogger
+
+
+def test_log_json_accepts_numpy_scalars(tmp_path):
+    logger = RAGLogger(log_dir=str(tmp_path), test_name="numpy")
+    logger.log_json({"faithfulness": np.float64(0.75), "count": np.int64(3), 1: "non-str key"}, title="Scores")
+    logger.close()
+
+    content = logger.log_file.read_text(encoding="utf-8")
+    assert '"faithfulness": 0.75' in content
+    assert '"count": 3' in content
+    assert '"1": "non-str key"' in content
@@ -0,0 +1,80 @@
+"""
+Tests for the SQLite-backed Ragas score cache.
+"""
+
+import sqlite3
+
+import pytest
+
+from src.core.ragas_cache import RagasScoreCache
+
+
+SAMPLE = {
+    "user_input": "When did Beyonce start becoming popular?",
+    "reference": "in the late 1990s",
+    "response": "In the late 1990s, as lead singer of Destiny's Child.",
+    "retrieved_contexts": ["Beyonce rose to fame in the late 1990s."],
+}
+
+
+def test_set_many_then_get_many_round_trip(tmp_path):
+    cache = RagasScoreCache(str(tmp_path / "scores.sqlite"))
+    faithfulness = RagasScoreCache.key("faithfulness", "gpt-4o-mini", **SAMPLE)
+    recall = RagasScoreCache.key("context_recall", "gpt-4o-mini", **SAMPLE)
+
+    cache.set_many({faithfulness: 0.75, recall: 1.0})
+
+    assert cache.get_many([faithfulness, recall, "missing"]) == {faithfulness: 0.75, recall: 1.0}
+    # Persisted: a new instance on the same file sees the scores
+    assert RagasScoreCache(str(tmp_path / "scores.sqlite")).get_many([faithfulness]) == {faithfulness: 0.75}
+
+
+def test_set_many_replaces_existing_score(tmp_path):
+    cache = RagasScoreCache(str(tmp_path / "scores.sqlite"))
+    key = RagasScoreCache.key("faithfulness", "gpt-4o-mini", **SAMPLE)
+
+    cache.set_many({key: 0.5})
+    cache.set_many({key: 0.25})
+
+    assert cache.get_many([key]) == {key: 0.25}
+
+
+def test_get_many_handles_more_keys_than_one_batch(tmp_path):
+    cache = RagasScoreCache(str(tmp_path / "scores.sqlite"))
+    scores = {f"key-{i}": i / 1000 for i in range(1200)}
+
+    cache.set_many(scores)
+
+    assert cache.get_many(scores) == scores
+
+
+def test_key_changes_with_metric_model_and_sample():
+    key = RagasScoreCache.key("faithfulness", "gpt-4o-mini", **SAMPLE)
+
+    assert key == RagasScoreCache.key("faithfulness", "gpt-4o-mini", **SAMPLE)
+    assert key != RagasScoreCache.key("context_recall", "gpt-4o-mini", **SAMPLE)
+    assert key != RagasScoreCache.key("faithfulness", "gpt-4o", **SAMPLE)
+    assert key != RagasScoreCache.key("faithfulness", "gpt-4o-mini", **{**SAMPLE, "response": "1990s"})
+    assert key != RagasScoreCache.key(
+        "faithfulness", "gpt-4o-mini", **{**SAMPLE, "retrieved_contexts": SAMPLE["retrieved_contexts"] * 2}
+    )
+
+
+def test_connections_are_closed(tmp_path, monkeypatch):
+    cache = RagasScoreCache(str(tmp_path / "scores.sqlite"))
+    opened = []
+    connect = cache._connect
+
+    def recording_connect():
+        conn = connect()
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(cache, "_connect", recording_connect)
+    cache.set_many({"key": 1.0})
+    cache.get_many(["key"])
+
+    assert len(opened) == 2
+    for conn in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
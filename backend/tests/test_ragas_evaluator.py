@@ -0,0 +1,53 @@
+"""
+Tests for RagasEvaluator scoring (stub metrics, no LLM calls).
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("ragas")
+
+from src.core import ragas_evaluator
+from src.core.ragas_evaluator import RagasEvaluator, RAGEvaluationSample
+
+
+class RateLimitedOnceMetric:
+    """Metric stub whose first call fails with an HTTP 429, then scores 0.8."""
+
+    name = "faithfulness"
+
+    def __init__(self):
+        self.calls = 0
+
+    async def single_turn_ascore(self, sample, callbacks=None, timeout=None):
+        self.calls += 1
+        if self.calls == 1:
+            raise Exception("Error code: 429 - {'error': {'code': 'rate_limit_exceeded'}}")
+        return 0.8
+
+
+@pytest.fixture
+def evaluator(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(ragas_evaluator, "llm_factory", lambda model: MagicMock())
+    monkeypatch.setattr(ragas_evaluator, "_rate_limit_delay", lambda attempt: 0)
+    return RagasEvaluator({"metrics": ["faithfulness"]})
+
+
+def test_rate_limited_metric_call_is_retried(evaluator):
+    metric = RateLimitedOnceMetric()
+    evaluator.metrics = [metric]
+
+    result = evaluator.evaluate_samples([
+        RAGEvaluationSample(
+            user_input="When did Beyonce start becoming popular?",
+            reference="in the late 1990s",
+            retrieved_contexts=["Beyonce rose to fame in the late 1990s."],
+            response="In the late 1990s.",
+        )
+    ])
+
+    assert metric.calls == 2
+    assert result.scores == {"faithfulness": 0.8}
+    assert result.raw_results == [{"faithfulness": 0.8}]